@@ -20,16 +20,234 @@ GitHub: https://github.com/cstroie/SystematicReviewAssistant
 Year: 2026
 """
 
+import argparse
+import hashlib
+import heapq
+import io
 import json
+import logging
+import os
+import re
 import sys
+from collections import Counter
+from collections.abc import Mapping
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 
+try:
+    import cairosvg
+except (ImportError, OSError):
+    cairosvg = None
 
-@dataclass
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+log = logging.getLogger(__name__)
+
+
+# Format aliases expanded by create_diagram_from_results
+_EXPAND_FORMATS = {'all': ('svg', 'html', 'png', 'tikz', 'dot')}
+
+# Large screening results are counted with numpy when it is installed
+_NUMPY_MIN_RECORDS = 10_000
+_DECISION_CODES = {'INCLUDE': 0, 'EXCLUDE': 1, 'UNCERTAIN': 2}
+
+# JSON arrays larger than this are streamed with ijson when it is installed
+_STREAM_MIN_BYTES = 64 * 1024 * 1024
+
+# File suffix written for each output format
+_FORMAT_SUFFIXES = {'svg': '.svg', 'html': '.html', 'png': '.png', 'tikz': '.tex', 'dot': '.dot'}
+
+# Whitespace collapsed when minifying SVG output
+_SVG_TAG_GAP_RE = re.compile(r'>\s+<')
+_SVG_LINE_BREAK_RE = re.compile(r'\s*\n\s*')
+
+# TikZ node and edge templates
+_TIKZ_BOX = "\\node[%s] (%s) at (%s,%s) {%s};"
+_TIKZ_ARROW = "\\draw[arrow] (%s) %s (%s);"
+_TIKZ_ARROW_LABEL = " node[midway, right=2pt] {\\footnotesize %s}"
+
+# Standalone document header and tikzpicture styles
+_TIKZ_PREAMBLE = r"""% PRISMA 2020 Flow Diagram (TikZ version)
+% Generated by SystematicReviewAssistant
+% https://github.com/cstroie/SystematicReviewAssistant
+
+\documentclass[tikz]{standalone}
+\usepackage{geometry}
+\usepackage{tikz}
+\usetikzlibrary{positioning, arrows.meta, shapes.geometric}
+\begin{document}
+
+\begin{tikzpicture}[
+    node distance=30pt and 10pt,
+    title/.style={font=\bfseries, anchor=west},
+    box/.style={
+        draw,
+        thick,
+        rectangle,
+        minimum width=9cm,
+        minimum height=1.2cm,
+        fill=white,
+        align=center,
+        text width=8.5cm
+    },
+    sidebox/.style={
+        draw,
+        thick,
+        rectangle,
+        minimum width=6cm,
+        minimum height=1.2cm,
+        fill=white,
+        align=center,
+        text width=5.5cm
+    },
+    arrow/.style={
+        -Stealth[scale=1.2],
+        thick,
+        shorten >=3pt,
+        shorten <=3pt
+    },
+    exclusiontitle/.style={
+        font=\bfseries,
+        anchor=center,
+        fill=white,
+        inner sep=3pt
+    }
+
+]
+"""
+
+
+# Static HTML page wrapping the SVG diagram and the selection summary
+_HTML_TEMPLATE = '''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title}</title>
+    <style>
+        body {{
+            font-family: Arial, sans-serif;
+            max-width: 900px;
+            margin: 0 auto;
+            padding: 20px;
+            background-color: #f5f5f5;
+        }}
+        .container {{
+            background-color: white;
+            padding: 30px;
+            border-radius: 8px;
+            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
+        }}
+        h1 {{
+            text-align: center;
+            color: #2C3E50;
+            margin-bottom: 30px;
+        }}
+        .diagram {{
+            text-align: center;
+            margin: 20px 0;
+        }}
+        svg {{
+            max-width: 100%;
+            height: auto;
+            border: 1px solid #ddd;
+            border-radius: 4px;
+        }}
+        .summary {{
+            margin-top: 30px;
+            padding: 15px;
+            background-color: #f9f9f9;
+            border-left: 4px solid #2C3E50;
+        }}
+        .summary h3 {{
+            margin-top: 0;
+            color: #2C3E50;
+        }}
+        .summary-item {{
+            margin: 10px 0;
+            font-size: 14px;
+        }}
+        .download-buttons {{
+            text-align: center;
+            margin: 20px 0;
+        }}
+        button {{
+            padding: 10px 20px;
+            margin: 5px;
+            background-color: #2C3E50;
+            color: white;
+            border: none;
+            border-radius: 4px;
+            cursor: pointer;
+            font-size: 14px;
+        }}
+        button:hover {{
+            background-color: #34495E;
+        }}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>{title}</h1>
+        
+        <div class="diagram">
+            {svg_content}
+        </div>
+        
+        <div class="summary">
+            <h3>Search and Selection Summary</h3>
+            <div class="summary-item"><strong>Records identified:</strong> {records_identified}</div>
+            <div class="summary-item"><strong>Records screened:</strong> {records_screened}</div>
+            <div class="summary-item"><strong>Records excluded:</strong> {records_excluded}</div>
+            <div class="summary-item"><strong>Full-text articles retrieved:</strong> {full_text_retrieved}</div>
+            <div class="summary-item"><strong>Full-text articles excluded:</strong> {full_text_excluded}</div>
+            <div class="summary-item"><strong>Studies included (qualitative):</strong> {studies_included_qualitative}</div>{quant_row}
+        </div>
+        
+        <div class="download-buttons">
+            <button onclick="downloadSVG()">Download as SVG</button>
+            <button onclick="downloadPNG()">Download as PNG</button>
+            <button onclick="window.print()">Print</button>
+        </div>
+    </div>
+    
+    <script>
+        function downloadSVG() {{
+            const svg = document.querySelector('svg');
+            const serializer = new XMLSerializer();
+            const svgString = serializer.serializeToString(svg);
+            const blob = new Blob([svgString], {{ type: 'image/svg+xml' }});
+            const url = URL.createObjectURL(blob);
+            const a = document.createElement('a');
+            a.href = url;
+            a.download = 'prisma_flow_diagram.svg';
+            a.click();
+        }}
+        
+        function downloadPNG() {{
+            alert('To download as PNG, right-click the diagram and select "Save image as..."\\nOr use an online SVG to PNG converter.');
+        }}
+    </script>
+</body>
+</html>
+'''
+_HTML_HEAD, _HTML_TAIL = _HTML_TEMPLATE.split('{svg_content}')
+_HTML_SUMMARY, _HTML_END = _HTML_TAIL.split('{quant_row}')
+_HTML_END = _HTML_END.format()  # static, only the doubled braces need undoing
+
+
+@dataclass(frozen=True, slots=True)
 class DiagramNumbers:
-    """PRISMA flow diagram data"""
+    """PRISMA flow diagram data (immutable and hashable)"""
     # Identification phase
     records_identified: int
     
@@ -44,7 +262,7 @@ class DiagramNumbers:
     studies_included_qualitative: int
     
     # Fields with default values must come after non-default fields
-    full_text_exclude_reasons: Dict[str, int] = None
+    full_text_exclude_reasons: tuple[tuple[str, int], ...] = ()
     studies_included_quantitative: int = None
     
     # Optional
@@ -52,6 +270,35 @@ class DiagramNumbers:
     register_count: int = 0
     other_sources_count: int = 0
     duplicates_removed: int = 0
+    
+    def __post_init__(self):
+        """Accept exclusion reasons given as a {reason: count} dict too"""
+        reasons = self.full_text_exclude_reasons
+        if isinstance(reasons, Mapping):
+            object.__setattr__(self, 'full_text_exclude_reasons', tuple(reasons.items()))
+        elif not isinstance(reasons, tuple):
+            raise TypeError("full_text_exclude_reasons must be a dict or a tuple of "
+                            f"(reason, count) pairs, not {type(reasons).__name__}")
+    
+    def top_exclude_reasons(self, n: int = 3) -> list[tuple[str, int]]:
+        """Return the n exclusion reasons with the highest counts"""
+        return heapq.nlargest(n, self.full_text_exclude_reasons, key=itemgetter(1))
+
+
+# Diagram colors, shared by the SVG drawing code and its style block
+_COLOR_IDENTIFICATION = '#E8F4F8'
+_COLOR_SCREENING = '#D4E8F0'
+_COLOR_ELIGIBILITY = '#C0DCE8'
+_COLOR_INCLUSION = '#ACE0E0'
+_COLOR_BORDER = '#2C3E50'
+_COLOR_TEXT = '#1A1A1A'
+_COLOR_ARROW = '#34495E'
+
+
+def _minify_svg(svg: str) -> str:
+    """Drop indentation and line breaks so the SVG fits on a single line"""
+    svg = _SVG_TAG_GAP_RE.sub('><', svg)
+    return _SVG_LINE_BREAK_RE.sub(' ', svg)
 
 
 class PRISMADiagramSVG:
@@ -64,48 +311,87 @@ class PRISMADiagramSVG:
     BOX_WIDTH = 400
     BOX_HEIGHT = 80
     COLORS = {
-        'identification': '#E8F4F8',
-        'screening': '#D4E8F0',
-        'eligibility': '#C0DCE8',
-        'inclusion': '#ACE0E0',
-        'border': '#2C3E50',
-        'text': '#1A1A1A',
-        'arrow': '#34495E'
+        'identification': _COLOR_IDENTIFICATION,
+        'screening': _COLOR_SCREENING,
+        'eligibility': _COLOR_ELIGIBILITY,
+        'inclusion': _COLOR_INCLUSION,
+        'border': _COLOR_BORDER,
+        'text': _COLOR_TEXT,
+        'arrow': _COLOR_ARROW
     }
     
-    def __init__(self, numbers: DiagramNumbers):
+    def __init__(self, numbers: DiagramNumbers, minify: bool = False):
         self.numbers = numbers
-        self.svg_elements = []
+        self.minify = minify
+        self.buf = io.StringIO()
         
     def generate(self) -> str:
-        """Generate complete SVG diagram"""
-        self.svg_elements = []
+        """Generate complete SVG diagram
+        
+        When minify is set, indentation and line breaks are dropped so the
+        document is emitted on a single line.
+        """
+        self.buf = io.StringIO()
+        self._draw_document()
+        
+        svg = self.buf.getvalue()
+        if self.minify:
+            svg = _minify_svg(svg)
+        return svg
+    
+    def generate_bytes(self) -> bytes:
+        """Generate complete SVG diagram as UTF-8 bytes
+        
+        The static header and footer come pre-encoded; only the drawn
+        phases are encoded per call.
+        """
+        self.buf = io.StringIO()
+        self._draw_phases()
+        body = self.buf.getvalue()
+        
+        default_size = self.WIDTH == PRISMADiagramSVG.WIDTH and self.HEIGHT == PRISMADiagramSVG.HEIGHT
+        if self.minify:
+            # Whitespace at the fragment edges sits between two tags and is dropped
+            body = _minify_svg(body.strip())
+            header = (_SVG_HEADER_MIN_BYTES if default_size else
+                      _minify_svg(self._get_header(self.WIDTH, self.HEIGHT)).rstrip().encode('utf-8'))
+        else:
+            header = (_SVG_HEADER_BYTES if default_size else
+                      self._get_header(self.WIDTH, self.HEIGHT).encode('utf-8'))
+        return b''.join((header, body.encode('utf-8'), _SVG_FOOTER_BYTES))
+    
+    def _draw_document(self):
+        """Draw header, all phases and footer into the current buffer"""
         self._add_svg_header()
-        self._draw_identification_phase()
-        self._draw_screening_phase()
-        self._draw_eligibility_phase()
-        self._draw_inclusion_phase()
+        self._draw_phases()
         self._add_svg_footer()
-        
-        return ''.join(self.svg_elements)
+    
+    def _draw_phases(self):
+        """Draw the four PRISMA phases into the current buffer"""
+        # Each phase is drawn once, starting where the previous one ended
+        y = self._draw_identification_phase(20)
+        y = self._draw_screening_phase(y)
+        y = self._draw_eligibility_phase(y)
+        self._draw_inclusion_phase(y)
+    
+    @classmethod
+    def _get_header(cls, width: int, height: int) -> str:
+        """Return the document header and style block for a canvas size"""
+        if width == cls.WIDTH and height == cls.HEIGHT:
+            return _SVG_HEADER
+        return _SVG_HEADER_TEMPLATE.format(WIDTH=width, HEIGHT=height) + _SVG_STYLE
     
     def _add_svg_header(self):
         """Add SVG document header"""
-        self.svg_elements.append(f'''<?xml version="1.0" encoding="UTF-8"?>
-<svg width="{self.WIDTH}" height="{self.HEIGHT}" xmlns="http://www.w3.org/2000/svg">
-  <style>
-    .phase-title {{ font-size: 14px; font-weight: bold; fill: {self.COLORS['text']}; }}
-    .box-title {{ font-size: 13px; font-weight: bold; fill: {self.COLORS['text']}; }}
-    .box-number {{ font-size: 16px; font-weight: bold; fill: {self.COLORS['text']}; }}
-    .box-label {{ font-size: 11px; fill: {self.COLORS['text']}; }}
-    .arrow {{ stroke: {self.COLORS['arrow']}; stroke-width: 2; fill: none; }}
-    .arrow-head {{ fill: {self.COLORS['arrow']}; }}
-  </style>
-''')
+        self.buf.write(self._get_header(self.WIDTH, self.HEIGHT))
+    
+    def _draw_phase_title(self, x: int, y: int, name: str):
+        """Draw a phase title label"""
+        self.buf.write(_SVG_PHASE_TITLES[name] % (x, y))
     
     def _add_svg_footer(self):
         """Close SVG document"""
-        self.svg_elements.append('</svg>')
+        self.buf.write('</svg>')
     
     def _draw_box(self, x: int, y: int, title: str, number: int, 
                   subtitle: str = None, color: str = '#FFFFFF') -> int:
@@ -113,53 +399,36 @@ class PRISMADiagramSVG:
         
         Returns: y position after box
         """
-        # Box background
-        self.svg_elements.append(f'''
-  <rect x="{x}" y="{y}" width="{self.BOX_WIDTH}" height="{self.BOX_HEIGHT}" 
-        fill="{color}" stroke="{self.COLORS['border']}" stroke-width="2" rx="4"/>
-''')
-        
-        # Main title
-        self.svg_elements.append(f'''
-  <text x="{x + 20}" y="{y + 25}" class="box-title">{title}</text>
-  <text x="{x + 20}" y="{y + 50}" class="box-number">n = {number}</text>
-''')
-        
-        # Subtitle if provided
-        if subtitle:
-            self.svg_elements.append(f'''
-  <text x="{x + 20}" y="{y + 70}" class="box-label">{subtitle}</text>
-''')
+        template = _BOX_TPL_SUB if subtitle else _BOX_TPL_NOSUB
+        self.buf.write(template.format(
+            x=x, y=y, w=self.BOX_WIDTH, h=self.BOX_HEIGHT,
+            color=color, border=_COLOR_BORDER,
+            tx=x + 20, ty1=y + 25, ty2=y + 50, ty3=y + 70,
+            title=title, number=number, subtitle=subtitle
+        ))
         
         return y + self.BOX_HEIGHT + 30
     
     def _draw_arrow(self, x1: int, y1: int, x2: int, y2: int, label: str = None):
         """Draw arrow between boxes"""
-        # Arrow line
-        self.svg_elements.append(f'''
-  <line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" class="arrow"/>
-  <polygon points="{x2},{y2} {x2-5},{y2-10} {x2+5},{y2-10}" class="arrow-head"/>
-''')
-        
-        # Label if provided
+        # Arrow line, the head is drawn by the shared marker definition
         if label:
-            mid_x = (x1 + x2) // 2 + 20
-            mid_y = (y1 + y2) // 2
-            self.svg_elements.append(f'''
-  <text x="{mid_x}" y="{mid_y}" class="box-label">{label}</text>
-''')
-    
-    def _draw_identification_phase(self):
-        """Draw identification phase (top of diagram)"""
+            self.buf.write(_ARROW_LABEL_TPL.format(
+                x1, y1, x2, y2, (x1 + x2) // 2 + 20, (y1 + y2) // 2, label))
+        else:
+            self.buf.write(_ARROW_TPL.format(x1, y1, x2, y2))
+    
+    def _draw_identification_phase(self, y: int) -> int:
+        """Draw identification phase (top of diagram)
+        
+        Returns: y position after the phase
+        """
         x = self.MARGIN
-        y = 20
         
         # Phase title
-        self.svg_elements.append(f'''
-  <text x="{x}" y="{y}" class="phase-title">IDENTIFICATION</text>
-''')
+        self._draw_phase_title(x, y, 'IDENTIFICATION')
         
-        y = 50
+        y += 30
         
         # Records identified
         sources = []
@@ -173,7 +442,7 @@ class PRISMADiagramSVG:
         subtitle = ", ".join(sources) if sources else ""
         y = self._draw_box(x, y, "Records identified", 
                           self.numbers.records_identified, subtitle, 
-                          self.COLORS['identification'])
+                          _COLOR_IDENTIFICATION)
         
         # Arrow to screening
         self._draw_arrow(x + self.BOX_WIDTH // 2, y - 30, 
@@ -181,34 +450,33 @@ class PRISMADiagramSVG:
         
         return y
     
-    def _draw_screening_phase(self):
-        """Draw screening phase"""
+    def _draw_screening_phase(self, y: int) -> int:
+        """Draw screening phase
+        
+        Returns: y position after the phase
+        """
         x = self.MARGIN
-        y = self._draw_identification_phase() + 20
+        y += 20
         
         # Phase title
-        self.svg_elements.append(f'''
-  <text x="{x}" y="{y}" class="phase-title">SCREENING</text>
-''')
+        self._draw_phase_title(x, y, 'SCREENING')
         
         y += 30
         
         # Records screened
         y = self._draw_box(x, y, "Records screened", 
                           self.numbers.records_screened,
-                          "", self.COLORS['screening'])
+                          "", _COLOR_SCREENING)
         
         # Records excluded (side by side)
         exclude_x = x + self.BOX_WIDTH + 100
         exclude_y = y - self.BOX_HEIGHT - 30
         
-        self.svg_elements.append(f'''
-  <text x="{exclude_x}" y="{exclude_y - 10}" class="phase-title">EXCLUSIONS</text>
-''')
+        self._draw_phase_title(exclude_x, exclude_y - 10, 'EXCLUSIONS')
         
         exclude_y = self._draw_box(exclude_x, exclude_y, "Records excluded",
                                   self.numbers.records_excluded,
-                                  "", self.COLORS['screening'])
+                                  "", _COLOR_SCREENING)
         
         # Arrow from screened to excluded
         self._draw_arrow(x + self.BOX_WIDTH, y - self.BOX_HEIGHT - 30,
@@ -220,42 +488,39 @@ class PRISMADiagramSVG:
         
         return y
     
-    def _draw_eligibility_phase(self):
-        """Draw eligibility phase (full-text review)"""
+    def _draw_eligibility_phase(self, y: int) -> int:
+        """Draw eligibility phase (full-text review)
+        
+        Returns: y position after the phase
+        """
         x = self.MARGIN
-        y = self._draw_screening_phase() + 20
+        y += 20
         
         # Phase title
-        self.svg_elements.append(f'''
-  <text x="{x}" y="{y}" class="phase-title">ELIGIBILITY</text>
-''')
+        self._draw_phase_title(x, y, 'ELIGIBILITY')
         
         y += 30
         
         # Full-text articles retrieved
         y = self._draw_box(x, y, "Full-text articles assessed",
                           self.numbers.full_text_retrieved,
-                          "", self.COLORS['eligibility'])
+                          "", _COLOR_ELIGIBILITY)
         
         # Excluded with reasons (side)
         exclude_x = x + self.BOX_WIDTH + 100
         exclude_y = y - self.BOX_HEIGHT - 30
         
-        self.svg_elements.append(f'''
-  <text x="{exclude_x}" y="{exclude_y - 10}" class="phase-title">EXCLUSIONS</text>
-''')
+        self._draw_phase_title(exclude_x, exclude_y - 10, 'EXCLUSIONS')
         
         exclude_reasons = ""
         if self.numbers.full_text_exclude_reasons:
-            reasons_list = []
-            for reason, count in self.numbers.full_text_exclude_reasons.items():
-                reasons_list.append(f"{reason} (n={count})")
-            exclude_reasons = "; ".join(reasons_list[:3])  # Max 3 reasons shown
+            items = self.numbers.top_exclude_reasons()  # Max 3 reasons shown
+            exclude_reasons = "; ".join(f"{r} (n={c})" for r, c in items)
         
         exclude_y = self._draw_box(exclude_x, exclude_y, "Full-text articles excluded",
                                   self.numbers.full_text_excluded,
                                   exclude_reasons if exclude_reasons else "",
-                                  self.COLORS['eligibility'])
+                                  _COLOR_ELIGIBILITY)
         
         # Arrow from retrieved to excluded
         self._draw_arrow(x + self.BOX_WIDTH, y - self.BOX_HEIGHT - 30,
@@ -267,85 +532,87 @@ class PRISMADiagramSVG:
         
         return y
     
-    def _draw_inclusion_phase(self):
+    def _draw_inclusion_phase(self, y: int):
         """Draw inclusion phase (final studies)"""
         x = self.MARGIN
-        y = self._draw_eligibility_phase() + 20
+        y += 20
         
         # Phase title
-        self.svg_elements.append(f'''
-  <text x="{x}" y="{y}" class="phase-title">INCLUSION</text>
-''')
+        self._draw_phase_title(x, y, 'INCLUSION')
         
         y += 30
         
         # Studies included in qualitative synthesis
         y = self._draw_box(x, y, "Studies included in qualitative synthesis",
                           self.numbers.studies_included_qualitative,
-                          "", self.COLORS['inclusion'])
+                          "", _COLOR_INCLUSION)
         
         # Studies included in quantitative synthesis (if provided)
         if self.numbers.studies_included_quantitative is not None:
             y = self._draw_box(x, y, "Studies included in quantitative synthesis",
                               self.numbers.studies_included_quantitative,
-                              "(meta-analysis)", self.COLORS['inclusion'])
+                              "(meta-analysis)", _COLOR_INCLUSION)
+
+
+# Static SVG fragments, rendered once from the PRISMADiagramSVG defaults
+_SVG_HEADER_TEMPLATE = '''<?xml version="1.0" encoding="UTF-8"?>
+<svg width="{WIDTH}" height="{HEIGHT}" xmlns="http://www.w3.org/2000/svg">
+'''
+_SVG_STYLE = f'''  <style>
+    .phase-title {{ font-size: 14px; font-weight: bold; fill: {_COLOR_TEXT}; }}
+    .box-title {{ font-size: 13px; font-weight: bold; fill: {_COLOR_TEXT}; }}
+    .box-number {{ font-size: 16px; font-weight: bold; fill: {_COLOR_TEXT}; }}
+    .box-label {{ font-size: 11px; fill: {_COLOR_TEXT}; }}
+    .arrow {{ stroke: {_COLOR_ARROW}; stroke-width: 2; fill: none; }}
+  </style>
+  <defs>
+    <marker id="arrow" viewBox="0 0 10 10" refX="10" refY="5" markerWidth="6" markerHeight="6" orient="auto">
+      <path d="M0,0 L10,5 L0,10 z" fill="{_COLOR_ARROW}"/>
+    </marker>
+  </defs>
+'''
+_SVG_HEADER = _SVG_HEADER_TEMPLATE.format(WIDTH=PRISMADiagramSVG.WIDTH,
+                                          HEIGHT=PRISMADiagramSVG.HEIGHT) + _SVG_STYLE
+_SVG_HEADER_BYTES = _SVG_HEADER.encode('utf-8')
+_SVG_HEADER_MIN_BYTES = _minify_svg(_SVG_HEADER).rstrip().encode('utf-8')
+_SVG_FOOTER_BYTES = b'</svg>'
+_SVG_PHASE_TITLES = {
+    name: '\n  <text x="%d" y="%d" class="phase-title">' + name + '</text>\n'
+    for name in ('IDENTIFICATION', 'SCREENING', 'ELIGIBILITY', 'EXCLUSIONS', 'INCLUSION')
+}
+
+# Box and arrow markup, filled in a single format call per element
+_BOX_TPL_NOSUB = '''
+  <rect x="{x}" y="{y}" width="{w}" height="{h}" 
+        fill="{color}" stroke="{border}" stroke-width="2" rx="4"/>
+
+  <text x="{tx}" y="{ty1}" class="box-title">{title}</text>
+  <text x="{tx}" y="{ty2}" class="box-number">n = {number}</text>
+'''
+_BOX_TPL_SUB = _BOX_TPL_NOSUB + '''
+  <text x="{tx}" y="{ty3}" class="box-label">{subtitle}</text>
+'''
+_ARROW_TPL = '''
+  <line x1="{0}" y1="{1}" x2="{2}" y2="{3}" class="arrow" marker-end="url(#arrow)"/>
+'''
+_ARROW_LABEL_TPL = _ARROW_TPL + '''
+  <text x="{4}" y="{5}" class="box-label">{6}</text>
+'''
 
 
 class PRISMADiagramTikZ:
     """Generate PRISMA 2020 flow diagram as TikZ code for LaTeX"""
     
+    # Edge operators for the bend angles used by the diagram
+    _ARROW_BEND_CACHE = {None: "--", 30: " to [bend left=30] "}
+    
     def __init__(self, numbers: DiagramNumbers):
         self.numbers = numbers
         self.tikz_elements = []
         
     def generate(self) -> str:
         """Generate complete TikZ diagram code"""
-        self.tikz_elements = [
-            "% PRISMA 2020 Flow Diagram (TikZ version)",
-            "% Generated by SystematicReviewAssistant",
-            "% https://github.com/cstroie/SystematicReviewAssistant\n",
-            "\\documentclass[tikz]{standalone}",
-            "\\usepackage{geometry}",
-            "\\usepackage{tikz}",
-            "\\usetikzlibrary{positioning, arrows.meta, shapes.geometric}",    
-            "\\begin{document}\n",
-            "\\begin{tikzpicture}[",
-            "    node distance=30pt and 10pt,",
-            "    title/.style={font=\\bfseries, anchor=west},",
-            "    box/.style={",
-            "        draw,",
-            "        thick,",
-            "        rectangle,",
-            "        minimum width=9cm,",
-            "        minimum height=1.2cm,",
-            "        fill=white,",
-            "        align=center,",
-            "        text width=8.5cm",
-            "    },",
-            "    sidebox/.style={",
-            "        draw,",
-            "        thick,",
-            "        rectangle,",
-            "        minimum width=6cm,",
-            "        minimum height=1.2cm,",
-            "        fill=white,",
-            "        align=center,",
-            "        text width=5.5cm",
-            "    },",
-            "    arrow/.style={",
-            "        -Stealth[scale=1.2],",
-            "        thick,",
-            "        shorten >=3pt,",
-            "        shorten <=3pt",
-            "    },",
-            "    exclusiontitle/.style={",
-            "        font=\\bfseries,",
-            "        anchor=center,",
-            "        fill=white,",
-            "        inner sep=3pt",
-            "    }\n",
-            "]\n"
-        ]
+        self.tikz_elements = [_TIKZ_PREAMBLE]
         
         # Layout coordinates
         x_main = 0
@@ -374,15 +641,15 @@ class PRISMADiagramTikZ:
             content += f" \\\\ \\footnotesize {subtitle}"
         
         name = f"{name_prefix}{int(abs(y))}"
-        self.tikz_elements.append(f"\\node[{style}] ({name}) at ({x},{y}) {{{content}}};")
+        self.tikz_elements.append(_TIKZ_BOX % (style, name, x, y, content))
         return y - 2.8  # Return new y position
     
     def _draw_arrow(self, from_node, to_node, label=None, bend=None):
         """Draw an arrow between nodes with optional label and bend"""
-        bend_cmd = f" to [bend left={bend}] " if bend else "--"
-        arrow = f"\\draw[arrow] ({from_node}) {bend_cmd} ({to_node});"
+        bend_cmd = self._ARROW_BEND_CACHE.get(bend) or f" to [bend left={bend}] "
+        arrow = _TIKZ_ARROW % (from_node, bend_cmd, to_node)
         if label:
-            arrow += f" node[midway, right=2pt] {{\\footnotesize {label}}}"
+            arrow += _TIKZ_ARROW_LABEL % label
         self.tikz_elements.append(arrow)
     
     def _draw_exclusion_title(self, x, y, text):
@@ -445,8 +712,8 @@ class PRISMADiagramTikZ:
         # Excluded with reasons
         excluded_text = ""
         if self.numbers.full_text_exclude_reasons:
-            reasons = ["• " + f"{k} (n={v})" for k, v in self.numbers.full_text_exclude_reasons.items()]
-            excluded_text = " \\\\ ".join(reasons[:3] if len(reasons) > 3 else reasons)
+            items = self.numbers.top_exclude_reasons()  # Max 3 reasons shown
+            excluded_text = " \\\\ ".join([f"• {k} (n={v})" for k, v in items])
         excluded_y = self._draw_box(exclude_x, y, "Full-text articles excluded",
                                    self.numbers.full_text_excluded, excluded_text,
                                    style="sidebox", name_prefix="excluded_eligibility")
@@ -539,133 +806,77 @@ class PRISMADiagramDOT:
 class PRISMADiagramHTML:
     """Generate PRISMA 2020 flow diagram as interactive HTML"""
     
-    def __init__(self, numbers: DiagramNumbers, title: str = "PRISMA 2020 Flow Diagram"):
+    def __init__(self, numbers: DiagramNumbers, title: str = "PRISMA 2020 Flow Diagram",
+                 svg_content: str | None = None):
         self.numbers = numbers
         self.title = title
+        self.svg_content = svg_content
     
     def generate(self) -> str:
         """Generate HTML with embedded visualization"""
-        svg_generator = PRISMADiagramSVG(self.numbers)
-        svg_content = svg_generator.generate()
-        
-        html = f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{self.title}</title>
-    <style>
-        body {{
-            font-family: Arial, sans-serif;
-            max-width: 900px;
-            margin: 0 auto;
-            padding: 20px;
-            background-color: #f5f5f5;
-        }}
-        .container {{
-            background-color: white;
-            padding: 30px;
-            border-radius: 8px;
-            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-        }}
-        h1 {{
-            text-align: center;
-            color: #2C3E50;
-            margin-bottom: 30px;
-        }}
-        .diagram {{
-            text-align: center;
-            margin: 20px 0;
-        }}
-        svg {{
-            max-width: 100%;
-            height: auto;
-            border: 1px solid #ddd;
-            border-radius: 4px;
-        }}
-        .summary {{
-            margin-top: 30px;
-            padding: 15px;
-            background-color: #f9f9f9;
-            border-left: 4px solid #2C3E50;
-        }}
-        .summary h3 {{
-            margin-top: 0;
-            color: #2C3E50;
-        }}
-        .summary-item {{
-            margin: 10px 0;
-            font-size: 14px;
-        }}
-        .download-buttons {{
-            text-align: center;
-            margin: 20px 0;
-        }}
-        button {{
-            padding: 10px 20px;
-            margin: 5px;
-            background-color: #2C3E50;
-            color: white;
-            border: none;
-            border-radius: 4px;
-            cursor: pointer;
-            font-size: 14px;
-        }}
-        button:hover {{
-            background-color: #34495E;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>{self.title}</h1>
-        
-        <div class="diagram">
-            {svg_content}
-        </div>
-        
-        <div class="summary">
-            <h3>Search and Selection Summary</h3>
-            <div class="summary-item"><strong>Records identified:</strong> {self.numbers.records_identified}</div>
-            <div class="summary-item"><strong>Records screened:</strong> {self.numbers.records_screened}</div>
-            <div class="summary-item"><strong>Records excluded:</strong> {self.numbers.records_excluded}</div>
-            <div class="summary-item"><strong>Full-text articles retrieved:</strong> {self.numbers.full_text_retrieved}</div>
-            <div class="summary-item"><strong>Full-text articles excluded:</strong> {self.numbers.full_text_excluded}</div>
-            <div class="summary-item"><strong>Studies included (qualitative):</strong> {self.numbers.studies_included_qualitative}</div>
-            {f'<div class="summary-item"><strong>Studies included (quantitative):</strong> {self.numbers.studies_included_quantitative}</div>' if self.numbers.studies_included_quantitative else ''}
-        </div>
-        
-        <div class="download-buttons">
-            <button onclick="downloadSVG()">Download as SVG</button>
-            <button onclick="downloadPNG()">Download as PNG</button>
-            <button onclick="window.print()">Print</button>
-        </div>
-    </div>
+        quant_row = ''
+        if self.numbers.studies_included_quantitative:
+            quant_row = ('\n            <div class="summary-item"><strong>Studies included (quantitative):</strong> '
+                         f'{self.numbers.studies_included_quantitative}</div>')
+        
+        svg_content = self.svg_content
+        if svg_content is None:
+            svg_content = PRISMADiagramSVG(self.numbers).generate()
+        
+        fields = asdict(self.numbers)
+        fields['title'] = self.title
+        return ''.join((_HTML_HEAD.format_map(fields), svg_content,
+                        _HTML_SUMMARY.format_map(fields), quant_row, _HTML_END))
+
+
+def _load_json(path):
+    """Load a JSON file, decoding raw bytes with orjson when available"""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def _iter_screening_records(path):
+    """Yield screening records one at a time without keeping them in memory
     
-    <script>
-        function downloadSVG() {{
-            const svg = document.querySelector('svg');
-            const serializer = new XMLSerializer();
-            const svgString = serializer.serializeToString(svg);
-            const blob = new Blob([svgString], {{ type: 'image/svg+xml' }});
-            const url = URL.createObjectURL(blob);
-            const a = document.createElement('a');
-            a.href = url;
-            a.download = 'prisma_flow_diagram.svg';
-            a.click();
-        }}
-        
-        function downloadPNG() {{
-            alert('To download as PNG, right-click the diagram and select "Save image as..."\\nOr use an online SVG to PNG converter.');
-        }}
-    </script>
-</body>
-</html>
-'''
-        return html
+    JSON Lines files are decoded line by line; large JSON arrays are
+    streamed item by item with ijson.
+    """
+    loads = orjson.loads if orjson is not None else json.loads
+    if Path(path).suffix == '.jsonl':
+        with open(path, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    yield loads(line)
+    else:
+        with open(path, 'rb') as f:
+            yield from ijson.items(f, 'item')
 
 
-def calculate_numbers_from_screening(screening_results: List[Dict]) -> DiagramNumbers:
+def _stream_screening_results(path) -> bool:
+    """Whether screening results should be streamed instead of loaded at once"""
+    if Path(path).suffix == '.jsonl':
+        return True
+    return ijson is not None and os.path.getsize(path) > _STREAM_MIN_BYTES
+
+
+def _count_decisions_numpy(screening_results: list[dict]) -> tuple[int, int, int] | None:
+    """Count INCLUDE/EXCLUDE/UNCERTAIN with numpy, or None if it is not installed"""
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    
+    codes = np.fromiter(
+        (_DECISION_CODES.get(r.get('decision'), 3) for r in screening_results),
+        dtype=np.int8, count=len(screening_results))
+    counts = np.bincount(codes, minlength=4)
+    return int(counts[0]), int(counts[1]), int(counts[2])
+
+
+def calculate_numbers_from_screening(screening_results: list[dict]) -> DiagramNumbers:
     """Calculate PRISMA numbers from screening results JSON
     
     Expected JSON structure from pipeline:
@@ -680,10 +891,20 @@ def calculate_numbers_from_screening(screening_results: List[Dict]) -> DiagramNu
     """
     
     total_records = len(screening_results)
-    included = sum(1 for r in screening_results if r.get('decision') == 'INCLUDE')
-    excluded = sum(1 for r in screening_results if r.get('decision') == 'EXCLUDE')
-    uncertain = sum(1 for r in screening_results if r.get('decision') == 'UNCERTAIN')
+    counts = None
+    if total_records > _NUMPY_MIN_RECORDS:
+        counts = _count_decisions_numpy(screening_results)
+    if counts is None:
+        # Count all decisions in a single pass
+        decisions = Counter(r.get('decision') for r in screening_results)
+        counts = (decisions['INCLUDE'], decisions['EXCLUDE'], decisions['UNCERTAIN'])
     
+    return _numbers_from_counts(total_records, *counts)
+
+
+def _numbers_from_counts(total_records: int, included: int, excluded: int,
+                         uncertain: int) -> DiagramNumbers:
+    """Build diagram numbers from the screening decision counts"""
     return DiagramNumbers(
         records_identified=total_records,
         records_screened=total_records,
@@ -694,90 +915,168 @@ def calculate_numbers_from_screening(screening_results: List[Dict]) -> DiagramNu
     )
 
 
+def _write_bytes(path: Path, content: str | bytes) -> None:
+    """Write text as UTF-8 bytes in a single buffered write"""
+    data = content if isinstance(content, bytes) else content.encode('utf-8')
+    with open(path, 'wb', buffering=max(len(data), 65536)) as f:
+        f.write(data)
+
+
+def _read_stamp(hash_file: Path) -> dict[str, dict]:
+    """Read the per-format digest and minify setting of the last outputs"""
+    try:
+        stamp = json.loads(hash_file.read_text())
+    except (FileNotFoundError, ValueError):
+        return {}
+    if not isinstance(stamp, dict):
+        return {}
+    return {fmt: entry for fmt, entry in stamp.items() if isinstance(entry, dict)}
+
+
+def _log_png_hint(info) -> None:
+    """Explain how to get a PNG when cairosvg is not installed"""
+    info("ℹ PNG generation: Install cairosvg or use SVG converter")
+    info("  - Online: https://convertio.co/svg-png/")
+    info("  - Or use 'inkscape prisma_flow_diagram.svg --export-png=diagram.png'")
+
+
 def create_diagram_from_results(
     screening_results_json: str,
     output_dir: str = ".",
-    formats: List[str] = None) -> Dict[str, str]:
+    formats: list[str] = None,
+    quiet: bool = False,
+    force: bool = False) -> dict[str, str]:
     """Create PRISMA diagram from pipeline screening results
     
     Args:
         screening_results_json: Path to 02_screening_results.json from pipeline
         output_dir: Directory to save outputs
         formats: List of formats to generate ('svg', 'html', 'png', 'tikz', 'dot')
+        quiet: Log progress at debug level only (for batch pipelines)
+        force: Regenerate outputs even when they look up to date
     
     Returns:
         Dictionary with paths to generated files
     """
     
+    info = log.debug if quiet else log.info
+    
     if formats is None:
         formats = ['svg', 'html']
     
-    if 'all' in formats:
-        formats = ['svg', 'html', 'png', 'tikz', 'dot']
+    formats = [f for fmt in formats for f in _EXPAND_FORMATS.get(fmt, (fmt,))]
     
-    # Load screening results
-    with open(screening_results_json, 'r') as f:
-        results = json.load(f)
+    output_dir = Path(output_dir)
+    base = output_dir / 'prisma_flow_diagram'
+    expected = {fmt: base.with_suffix(_FORMAT_SUFFIXES[fmt]) for fmt in formats
+                if fmt in _FORMAT_SUFFIXES and (fmt != 'png' or cairosvg is not None)}
     
-    # Calculate numbers
-    numbers = calculate_numbers_from_screening(results)
+    # Nothing renderable was requested, e.g. PNG without cairosvg
+    if not expected:
+        if 'png' in formats:
+            _log_png_hint(info)
+        return {}
     
-    output_dir = Path(output_dir)
-    output_dir.mkdir(exist_ok=True)
-    output_files = {}
-    
-    # Generate SVG
-    if 'svg' in formats:
-        svg_generator = PRISMADiagramSVG(numbers)
-        svg_content = svg_generator.generate()
-        svg_file = output_dir / 'prisma_flow_diagram.svg'
-        with open(svg_file, 'w') as f:
-            f.write(svg_content)
+    minify = os.environ.get('PRISMA_PRETTY') != '1'
+    hash_file = output_dir / '.prisma_cache.hash'
+    stamp = _read_stamp(hash_file)
+    
+    # Make-style check for svg-only runs: an SVG newer than the input and
+    # rendered with the same minify setting needs no work at all
+    if not force and formats == ['svg'] and stamp.get('svg', {}).get('minify') == minify:
+        try:
+            source_mtime = os.stat(screening_results_json).st_mtime
+            if expected['svg'].stat().st_mtime >= source_mtime:
+                info("✓ PRISMA diagrams are up to date")
+                return {'svg': str(expected['svg'])}
+        except FileNotFoundError:
+            pass
+    
+    # Load screening results and calculate numbers; JSON Lines and large
+    # arrays are counted record by record without building the full list
+    if _stream_screening_results(screening_results_json):
+        decisions = Counter(r.get('decision')
+                            for r in _iter_screening_records(screening_results_json))
+        numbers = _numbers_from_counts(sum(decisions.values()), decisions['INCLUDE'],
+                                       decisions['EXCLUDE'], decisions['UNCERTAIN'])
+    else:
+        results = _load_json(screening_results_json)
+        numbers = calculate_numbers_from_screening(results)
+    
+    output_dir.mkdir(parents=True, exist_ok=True)
+    
+    # The stamp maps each format to the digest of the numbers and settings
+    # it was last rendered with; only formats whose digest differs are redone
+    digest = hashlib.sha256(json.dumps({'numbers': asdict(numbers), 'minify': minify},
+                                       sort_keys=True).encode()).hexdigest()
+    stale = {fmt for fmt, path in expected.items()
+             if force or stamp.get(fmt, {}).get('digest') != digest or not path.exists()}
+    output_files = {fmt: str(path) for fmt, path in expected.items() if fmt not in stale}
+    if not stale:
+        info("✓ PRISMA diagrams are up to date")
+        return output_files
+    
+    # Render the SVG once, minified unless pretty output is requested;
+    # the same markup is reused for the HTML page and the PNG
+    svg_bytes = None
+    if stale & {'svg', 'html', 'png'}:
+        svg_bytes = PRISMADiagramSVG(numbers, minify=minify).generate_bytes()
+    
+    if 'svg' in stale:
+        svg_file = base.with_suffix('.svg')
+        _write_bytes(svg_file, svg_bytes)
         output_files['svg'] = str(svg_file)
-        print(f"✓ SVG diagram saved: {svg_file}")
+        info(f"✓ SVG diagram saved: {svg_file}")
     
     # Generate TikZ (LaTeX)
-    if 'tikz' in formats:
+    if 'tikz' in stale:
         tikz_generator = PRISMADiagramTikZ(numbers)
         tikz_content = tikz_generator.generate()
-        tex_file = output_dir / 'prisma_flow_diagram.tex'
+        tex_file = base.with_suffix('.tex')
         with open(tex_file, 'w') as f:
             f.write(tikz_content)
         output_files['tikz'] = str(tex_file)
-        print(f"✓ TikZ diagram saved: {tex_file}")
+        info(f"✓ TikZ diagram saved: {tex_file}")
     
     # Generate DOT (Graphviz)
-    if 'dot' in formats:
+    if 'dot' in stale:
         dot_generator = PRISMADiagramDOT(numbers)
         dot_content = dot_generator.generate()
-        dot_file = output_dir / 'prisma_flow_diagram.dot'
+        dot_file = base.with_suffix('.dot')
         with open(dot_file, 'w') as f:
             f.write(dot_content)
         output_files['dot'] = str(dot_file)
-        print(f"✓ DOT diagram saved: {dot_file}")
+        info(f"✓ DOT diagram saved: {dot_file}")
     
     # Generate HTML
-    if 'html' in formats:
-        html_generator = PRISMADiagramHTML(numbers)
+    if 'html' in stale:
+        html_generator = PRISMADiagramHTML(numbers, svg_content=svg_bytes.decode('utf-8'))
         html_content = html_generator.generate()
-        html_file = output_dir / 'prisma_flow_diagram.html'
-        with open(html_file, 'w') as f:
-            f.write(html_content)
+        html_file = base.with_suffix('.html')
+        _write_bytes(html_file, html_content)
         output_files['html'] = str(html_file)
-        print(f"✓ HTML diagram saved: {html_file}")
+        info(f"✓ HTML diagram saved: {html_file}")
     
-    # PNG generation requires external tool
-    if 'png' in formats:
-        print("ℹ PNG generation: Use SVG converter")
-        print("  - Online: https://convertio.co/svg-png/")
-        print("  - Or use 'inkscape prisma_flow_diagram.svg --export-png=diagram.png'")
+    # Render PNG in-process when cairosvg is available
+    if 'png' in stale:
+        png_file = base.with_suffix('.png')
+        cairosvg.svg2png(bytestring=svg_bytes,
+                         write_to=str(png_file), output_width=1600)
+        output_files['png'] = str(png_file)
+        info(f"✓ PNG diagram saved: {png_file}")
+    elif 'png' in formats and cairosvg is None:
+        _log_png_hint(info)
     
     # DOT generation note
-    if 'dot' in formats:
-        print("ℹ DOT format: Use Graphviz to render to other formats")
-        print("  - Convert to PNG: 'dot -Tpng prisma_flow_diagram.dot -o diagram.png'")
-        print("  - Convert to SVG: 'dot -Tsvg prisma_flow_diagram.dot -o diagram.svg'")
-        print("  - Convert to PDF: 'dot -Tpdf prisma_flow_diagram.dot -o diagram.pdf'")
+    if 'dot' in stale:
+        info("ℹ DOT format: Use Graphviz to render to other formats")
+        info("  - Convert to PNG: 'dot -Tpng prisma_flow_diagram.dot -o diagram.png'")
+        info("  - Convert to SVG: 'dot -Tsvg prisma_flow_diagram.dot -o diagram.svg'")
+        info("  - Convert to PDF: 'dot -Tpdf prisma_flow_diagram.dot -o diagram.pdf'")
+    
+    for fmt in stale:
+        stamp[fmt] = {'digest': digest, 'minify': minify}
+    hash_file.write_text(json.dumps(stamp, sort_keys=True))
     
     return output_files
 
@@ -785,33 +1084,34 @@ def create_diagram_from_results(
 def main():
     """Command-line interface"""
     
-    if len(sys.argv) < 2:
-        print("PRISMA 2020 Flow Diagram Generator")
-        print("\nUsage:")
-        print("  python prisma_flow_diagram.py <screening_results.json>")
-        print("  python prisma_flow_diagram.py <screening_results.json> --format svg")
-        print("  python prisma_flow_diagram.py <screening_results.json> --format all")
-        print("\nFormats: svg (default), html, png, tikz, dot, all")
-        print("\nExample:")
-        print("  python prisma_flow_diagram.py output/02_screening_results.json --format all")
-        sys.exit(1)
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     
-    results_file = sys.argv[1]
+    parser = argparse.ArgumentParser(
+        description='PRISMA 2020 Flow Diagram Generator',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Formats: svg, html, png, tikz, dot, all (comma-separated)
+
+Example:
+  python prisma_flow_diagram.py output/02_screening_results.json --format all
+        """
+    )
+    parser.add_argument('results_file', help='Screening results JSON from the pipeline')
+    parser.add_argument('--format', default='svg,html', help='Output formats (default: svg,html)')
+    parser.add_argument('--output-dir', help='Output directory (default: next to the results file)')
+    parser.add_argument('--force', action='store_true', help='Regenerate diagrams even if they are up to date')
+    args = parser.parse_args()
     
-    # Parse format argument
-    formats = ['svg', 'html']
-    if '--format' in sys.argv:
-        idx = sys.argv.index('--format')
-        if idx + 1 < len(sys.argv):
-            formats = [sys.argv[idx + 1]]
+    results_file = args.results_file
+    results_path = Path(results_file)
+    formats = [fmt.strip() for fmt in args.format.split(',') if fmt.strip()]
     
     # Validate file exists
-    if not Path(results_file).exists():
+    if not results_path.exists():
         print(f"Error: File not found: {results_file}")
         sys.exit(1)
     
-    # Get output directory
-    output_dir = Path(results_file).parent
+    output_dir = Path(args.output_dir) if args.output_dir else results_path.parent
     
     # Generate diagrams
     print(f"\nGenerating PRISMA flow diagrams...")
@@ -820,7 +1120,8 @@ def main():
     output_files = create_diagram_from_results(
         results_file,
         output_dir=output_dir,
-        formats=formats
+        formats=formats,
+        force=args.force
     )
     
     print(f"\n✓ Diagrams created successfully!")
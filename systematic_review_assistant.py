@@ -56,17 +56,26 @@ Usage:
 import json
 import yaml
 import csv
+import gzip
 import time
 import sys
 import os
 import argparse
 import urllib.request
 import urllib.error
+import http.client
+import io
 import re
 import random
-from typing import List, Dict, Any, Optional
+import hashlib
+import threading
+import asyncio
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Iterator, Optional
 from pathlib import Path
 import html
+import xml.etree.ElementTree as ET
 from datetime import datetime
 import urllib.parse
 
@@ -75,8 +84,166 @@ try:
 except ImportError:
     pd = None
 
+try:
+    from lxml import etree as lxml_etree
+except ImportError:
+    lxml_etree = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# JSON (de)serialization for request/response bodies and LLM answers.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so the existing
+# except clauses catch both
+if orjson is not None:
+    def _dumps(obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj)
+        except orjson.JSONEncodeError:
+            # Non-str dict keys and ints beyond 64 bits, which json accepts
+            return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+    _loads = orjson.loads
+else:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+    _loads = json.loads
+
+# libyaml's C emitter when PyYAML was built with it, same output
+_YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+# Typed LLM response schemas: msgspec only builds the fields declared here,
+# skipping everything else in the response body
+_RESPONSE_DECODERS = {}
+if msgspec is not None:
+    class _TextBlock(msgspec.Struct):
+        text: str = ''
+
+    class _AnthropicResponse(msgspec.Struct):
+        content: List[_TextBlock] = msgspec.field(default_factory=list)
+
+    class _Message(msgspec.Struct):
+        content: Optional[str] = None
+
+    class _Choice(msgspec.Struct):
+        message: _Message = msgspec.field(default_factory=_Message)
+
+    class _OpenAIResponse(msgspec.Struct):
+        choices: List[_Choice] = msgspec.field(default_factory=list)
+
+    _anthropic_decoder = msgspec.json.Decoder(_AnthropicResponse)
+    _openai_decoder = msgspec.json.Decoder(_OpenAIResponse)
+
+    def _decode_anthropic(raw: bytes) -> str:
+        content = _anthropic_decoder.decode(raw).content
+        return content[0].text if content else ''
+
+    def _decode_openai(raw: bytes) -> str:
+        choices = _openai_decoder.decode(raw).choices
+        return (choices[0].message.content or '') if choices else ''
+
+    _RESPONSE_DECODERS = {'anthropic': _decode_anthropic, 'openai': _decode_openai}
+
 MAX_PROMPT_SIZE =  1 * 1024 * 1024  #  1MB
 MAX_INPUT_SIZE  = 50 * 1024 * 1024  # 50MB
+MAX_SYNTHESIS_SAMPLE = 32000        # Characters of study data in the synthesis prompt
+
+# Sanitization patterns, compiled once
+_FILENAME_UNSAFE_RE = re.compile(r'[\\/:\*\?"<>\|\s]')
+_PATH_RE = re.compile(r'/[\w/.-]+')
+_API_KEY_RE = re.compile(r'\b[A-Za-z0-9]{32,64}\b')
+_MODEL_ID_RE = re.compile(r'\b\d{4,}-\w+\b')
+_CONTROL_CHARS_RE = re.compile(r'[\x00-\x1F\x7F]')
+_URL_ESCAPE_RE = re.compile(r'%[0-9a-f]{2}', re.IGNORECASE)
+_UNICODE_ESCAPE_RE = re.compile(r'\\u[0-9a-f]{4}', re.IGNORECASE)
+
+# JSON in LLM responses: a ```json fenced block first, else the first
+# balanced object; the token pattern skips whole string literals, so
+# brackets inside strings are not counted
+_JSON_FENCE_RE = re.compile(r'```json\s*({.*?})\s*```', re.DOTALL)
+_JSON_ARRAY_FENCE_RE = re.compile(r'```json\s*(\[.*?\])\s*```', re.DOTALL)
+_JSON_TOKEN_RE = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[{}\[\]]')
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9]')
+
+# Fixed leading columns of 06_summary_characteristics.csv
+_SUMMARY_COLUMNS = (
+    'PMID', 'Year', 'Study Design', 'Clinical Domain', 'Imaging Modality',
+    'Sample Size (N)', 'Sensitivity', 'Specificity', 'AUC', 'Accuracy',
+    'Main Findings',
+)
+
+# Suspicious HTML in API responses
+_HTML_DANGER_SOURCES = (
+    r'<script.*?>',     # Script tags
+    r'on\w+\s*=',       # HTML event handlers
+    r'javascript:',     # JS protocols
+    r'<\s*iframe\b',    # IFrames
+    r'<\s*link\b',      # Link tags
+    r'<\s*meta\b',      # Meta tags
+    r'/\*\*/.*?/\*\*/',  # Obfuscated patterns
+)
+_HTML_DANGER_PATTERNS = tuple(re.compile(p, re.IGNORECASE | re.DOTALL)
+                              for p in _HTML_DANGER_SOURCES)
+_HTML_DANGER_RE = re.compile('|'.join(_HTML_DANGER_SOURCES), re.IGNORECASE | re.DOTALL)
+
+# MEDLINE field lines ("TAG - value") and the PMID line that starts a record
+_MEDLINE_FIELD_RE = re.compile(rb'^([A-Z]+)\s*-\s*(.*)')
+_PMID_RE = re.compile(rb'^PMID-\s*\d+', re.MULTILINE)
+
+# MEDLINE field codes and their standard article field names
+_MEDLINE_FIELD_MAP = {
+    'PMID': 'pmid',
+    'TI': 'title',
+    'AB': 'abstract',
+    'AU': 'authors',
+    'FAU': 'authors_full',
+    'AD': 'affiliation',
+    'SO': 'source',
+    'TA': 'journal',
+    'JT': 'journal_full',
+    'VI': 'volume',
+    'IP': 'issue',
+    'DP': 'pub_date',
+    'PG': 'pages',
+    'AID': 'article_id',
+    'DOI': 'doi',
+    'PT': 'publication_type',
+    'DEP': 'electronic_pub_date',
+    'PL': 'publisher_location',
+    'LA': 'language',
+    'OT': 'keywords',
+}
+
+# Tags found in almost every PubMed MEDLINE record, checked before the
+# generic uppercase test that still accepts any other tag
+_MEDLINE_TAGS = frozenset(tag.encode('ascii') for tag in _MEDLINE_FIELD_MAP) | {
+    b'OWN', b'STAT', b'DCOM', b'LR', b'IS', b'LID', b'JID', b'SB', b'MH',
+    b'EDAT', b'MHDA', b'CRDT', b'PHST', b'PST', b'GR', b'OID', b'COIS',
+}
+
+# PubMed XML elements read by PubMedParser._parse_xml_article
+_XML_ARTICLE_TAGS = ('PMID', 'ArticleTitle', 'Abstract', 'AbstractText', 'Author',
+                     'Journal', 'PubDate', 'ArticleId')
+
+# Export formats recognised from the file extension alone
+_FORMAT_BY_SUFFIX = {'.csv': 'csv', '.xml': 'xml', '.json': 'json'}
+
+# Standard article fields and their PubMed CSV export columns (PMID first)
+_CSV_FIELDS = (
+    ('pmid', 'PMID'),
+    ('title', 'Title'),
+    ('abstract', 'Abstract'),
+    ('authors', 'Authors'),
+    ('journal', 'Journal'),
+    ('pub_date', 'Publication Date'),
+    ('doi', 'DOI'),
+)
 
 def validate_file_path(path: str, max_size: Optional[int] = None) -> Path:
     """
@@ -121,15 +288,15 @@ def sanitize_filename(name: str) -> str:
     200 characters to prevent excessively long filenames.
     """
     # Remove any path separators and other dangerous characters
-    cleaned = re.sub(r'[\\/:\*\?"<>\|\s]', '_', name)
+    cleaned = _FILENAME_UNSAFE_RE.sub('_', name)
     return cleaned[:200]  # Prevent excessively long filenames
 
 def sanitize_error_message(msg: str) -> str:
     """Sanitize error messages to prevent leaking sensitive information"""
     # Remove potential paths and API keys
-    msg = re.sub(r'/[\w/.-]+', '[PATH]', msg)  # Paths
-    msg = re.sub(r'\b[A-Za-z0-9]{32,64}\b', '[API_KEY]', msg)  # Long hex strings
-    msg = re.sub(r'\b\d{4,}-\w+\b', '[MODEL_ID]', msg)  # Model IDs
+    msg = _PATH_RE.sub('[PATH]', msg)  # Paths
+    msg = _API_KEY_RE.sub('[API_KEY]', msg)  # Long hex strings
+    msg = _MODEL_ID_RE.sub('[MODEL_ID]', msg)  # Model IDs
     return msg
 
 def validate_llm_json_response(json_data: Dict[str, Any], required_keys: list,
@@ -165,10 +332,55 @@ def validate_llm_json_response(json_data: Dict[str, Any], required_keys: list,
 
     return json_data
 
+def _balanced_spans(text: str, opener: str, closer: str) -> Iterator[str]:
+    """Yield the top-level balanced opener...closer spans of text in order"""
+    start = text.find(opener)
+    while start >= 0:
+        depth = 0
+        for token in _JSON_TOKEN_RE.finditer(text, start):
+            if token.group() == opener:
+                depth += 1
+            elif token.group() == closer:
+                depth -= 1
+                if depth == 0:
+                    yield text[start:token.end()]
+                    break
+        else:
+            return  # Never closed
+        start = text.find(opener, token.end())
+
+def parse_llm_json(response_text: str, array: bool = False) -> Any:
+    """Decode the JSON object (or array) in an HTML-escaped LLM response"""
+    opener, closer = '[]' if array else '{}'
+    text = html.unescape(response_text)
+
+    # Answers in JSON mode are the document itself, so try that first and
+    # only search for a fenced block or a balanced span if it fails
+    if text.lstrip().startswith(opener):
+        try:
+            return _loads(text)
+        except json.JSONDecodeError:
+            pass
+    fence_match = (_JSON_ARRAY_FENCE_RE if array else _JSON_FENCE_RE).search(text)
+    if fence_match:
+        return _loads(fence_match.group(1))
+
+    # Prose may hold bracketed fragments that are not JSON; take the first
+    # top-level span that decodes, never a fragment nested inside one
+    first_error = None
+    for span in _balanced_spans(text, opener, closer):
+        try:
+            return _loads(span)
+        except json.JSONDecodeError as e:
+            first_error = first_error or e
+    if first_error is not None:
+        raise first_error
+    raise ValueError(f"No JSON {'array' if array else 'object'} found in LLM response")
+
 def sanitize_api_input(text: str) -> str:
     """Basic sanitization for text used in API calls"""
     # Remove control characters and limit length
-    sanitized = re.sub(r'[\x00-\x1F\x7F]', '', text)
+    sanitized = _CONTROL_CHARS_RE.sub('', text)
     return sanitized[:10000]  # Limit to reasonable length
 
 
@@ -185,14 +397,11 @@ API_CONFIGS = {
             'x-api-key': key,
             'anthropic-version': '2023-06-01'
         },
-        'body_fn': lambda prompt, model: {
-            'model': model,
-            'max_tokens': 4096,
-            'messages': [
-                {'role': 'user', 'content': prompt}
-            ]
+        'body_params': {
+            'max_tokens': 4096
         },
-        'response_fn': lambda resp: resp.get('content', [{}])[0].get('text', '')
+        'response_fn': lambda resp: resp.get('content', [{}])[0].get('text', ''),
+        'response_schema': 'anthropic'
     },
     'openrouter': {
         'base_url': 'https://openrouter.ai/api/v1',
@@ -205,15 +414,12 @@ API_CONFIGS = {
             'Authorization': f'Bearer {key}',
             'HTTP-Referer': 'https://github.com/cstroie/lit-review'
         },
-        'body_fn': lambda prompt, model: {
-            'model': model,
+        'body_params': {
             'max_tokens': 4096,
-            'temperature': 0.3,
-            'messages': [
-                {'role': 'user', 'content': prompt}
-            ]
+            'temperature': 0.3
         },
-        'response_fn': lambda resp: resp.get('choices', [{}])[0].get('message', {}).get('content', '')
+        'response_fn': lambda resp: resp.get('choices', [{}])[0].get('message', {}).get('content', ''),
+        'response_schema': 'openai'
     },
     'together': {
         'base_url': 'https://api.together.xyz/v1',
@@ -225,15 +431,12 @@ API_CONFIGS = {
             'Content-Type': 'application/json',
             'Authorization': f'Bearer {key}'
         },
-        'body_fn': lambda prompt, model: {
-            'model': model,
+        'body_params': {
             'max_tokens': 4096,
-            'temperature': 0.3,
-            'messages': [
-                {'role': 'user', 'content': prompt}
-            ]
+            'temperature': 0.3
         },
-        'response_fn': lambda resp: resp.get('choices', [{}])[0].get('message', {}).get('content', '')
+        'response_fn': lambda resp: resp.get('choices', [{}])[0].get('message', {}).get('content', ''),
+        'response_schema': 'openai'
     },
     'groq': {
         'base_url': 'https://api.groq.com/openai/v1',
@@ -245,15 +448,12 @@ API_CONFIGS = {
             'Content-Type': 'application/json',
             'Authorization': f'Bearer {key}'
         },
-        'body_fn': lambda prompt, model: {
-            'model': model,
+        'body_params': {
             'max_tokens': 8192,
-            'temperature': 0.3,
-            'messages': [
-                {'role': 'user', 'content': prompt}
-            ]
+            'temperature': 0.3
         },
-        'response_fn': lambda resp: resp.get('choices', [{}])[0].get('message', {}).get('content', '')
+        'response_fn': lambda resp: resp.get('choices', [{}])[0].get('message', {}).get('content', ''),
+        'response_schema': 'openai'
     },
     'local': {
         'base_url': 'http://localhost:11434/v1',
@@ -264,15 +464,12 @@ API_CONFIGS = {
         'headers_fn': lambda key, model: {
             'Content-Type': 'application/json'
         },
-        'body_fn': lambda prompt, model: {
-            'model': model,
+        'body_params': {
             'max_tokens': 2048,
-            'temperature': 0.3,
-            'messages': [
-                {'role': 'user', 'content': prompt}
-            ]
+            'temperature': 0.3
         },
-        'response_fn': lambda resp: resp.get('choices', [{}])[0].get('message', {}).get('content', '')
+        'response_fn': lambda resp: resp.get('choices', [{}])[0].get('message', {}).get('content', ''),
+        'response_schema': 'openai'
     }
 }
 
@@ -295,49 +492,102 @@ class PubMedDownloader:
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key
         self.base_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
+        # NCBI allows 3 requests per second without an API key, 10 with one
+        self.max_rate = 10 if api_key else 3
+        self._request_times = deque()
+        self._rate_lock = threading.Lock()
+        # The efetch parameters that never change, encoded once
+        fixed = {'db': 'pubmed', 'rettype': 'medline', 'retmode': 'text'}
+        if api_key:
+            fixed['api_key'] = api_key
+        self._efetch_url = f"{self.base_url}/efetch.fcgi?{urllib.parse.urlencode(fixed)}"
+        # History server handle of the last search_pubmed() call
+        self.webenv: Optional[str] = None
+        self.query_key: Optional[str] = None
+    
+    def _wait_for_slot(self) -> None:
+        """Block until one more request fits in the NCBI per-second limit"""
+        with self._rate_lock:
+            now = time.monotonic()
+            while self._request_times and now - self._request_times[0] >= 1.0:
+                self._request_times.popleft()
+            if len(self._request_times) >= self.max_rate:
+                time.sleep(1.0 - (now - self._request_times.popleft()))
+            self._request_times.append(time.monotonic())
     
     def download_medline(self, pmids: List[str], output_file: str, batch_size: int = 200) -> None:
         """
         Download PubMed articles in MEDLINE format
         
+        Batches are fetched concurrently within the NCBI rate limit and
+        written in their original order.
+        
         Args:
             pmids: List of PubMed IDs to download
-            output_file: Path to save MEDLINE file
+            output_file: Path to save MEDLINE file (gzip-compressed if it ends in .gz)
             batch_size: Number of PMIDs per request (max 200)
         """
         # Split into batches
         batches = [pmids[i:i + batch_size] for i in range(0, len(pmids), batch_size)]
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            for i, batch in enumerate(batches):
-                print(f"Downloading batch {i+1}/{len(batches)} ({len(batch)} PMIDs)...")
-                self._download_batch(batch, f)
-                time.sleep(0.5)  # Rate limiting
+        with self._open_output(output_file) as f, \
+                ThreadPoolExecutor(max_workers=self.max_rate) as executor:
+            for i, content in enumerate(executor.map(self._fetch_batch, batches)):
+                print(f"Downloaded batch {i+1}/{len(batches)} ({len(batches[i])} PMIDs)")
+                f.write(content)
         
         print(f"✓ Downloaded {len(pmids)} articles to {output_file}")
     
-    def _download_batch(self, pmids: List[str], file_handle) -> None:
-        """Download a single batch of PMIDs"""
-        pmid_str = ",".join(pmids)
+    def download_via_history(self, webenv: str, query_key: str, total: int,
+                             output_file: str, chunk: int = 10000) -> None:
+        """
+        Download search results in MEDLINE format from the NCBI history server
         
-        params = {
-            'db': 'pubmed',
-            'id': pmid_str,
-            'rettype': 'medline',
-            'retmode': 'text'
-        }
+        The results of a search_pubmed() call are fetched by position, so no
+        PMID lists are sent and each request can return up to 10000 records.
         
-        if self.api_key:
-            params['api_key'] = self.api_key
+        Args:
+            webenv: WebEnv returned by the search
+            query_key: Query key returned by the search
+            total: Number of records to download
+            output_file: Path to save MEDLINE file (gzip-compressed if it ends in .gz)
+            chunk: Number of records per request (max 10000)
+        """
+        starts = range(0, total, chunk)
         
-        # Build URL
-        query = urllib.parse.urlencode(params)
-        url = f"{self.base_url}/efetch.fcgi?{query}"
+        def fetch(start: int) -> str:
+            return self._efetch({'WebEnv': webenv, 'query_key': query_key,
+                                 'retstart': start, 'retmax': chunk})
+        
+        with self._open_output(output_file) as f, \
+                ThreadPoolExecutor(max_workers=self.max_rate) as executor:
+            for i, content in enumerate(executor.map(fetch, starts)):
+                print(f"Downloaded chunk {i+1}/{len(starts)} (records {starts[i]+1}-{min(starts[i]+chunk, total)})")
+                f.write(content)
         
+        print(f"✓ Downloaded {total} articles to {output_file}")
+    
+    @staticmethod
+    def _open_output(output_file: str):
+        """Open the MEDLINE output file, gzip-compressed if it ends in .gz"""
+        # Level 1 compresses MEDLINE text several times over while staying
+        # far faster than the download itself
+        if output_file.lower().endswith('.gz'):
+            return gzip.open(output_file, 'wt', encoding='utf-8', compresslevel=1)
+        return open(output_file, 'w', encoding='utf-8')
+    
+    def _fetch_batch(self, pmids: List[str]) -> str:
+        """Download a single batch of PMIDs and return the MEDLINE text"""
+        return self._efetch({'id': ",".join(pmids)})
+    
+    def _efetch(self, selection: Dict[str, Any]) -> str:
+        """Run one efetch request for MEDLINE text of the selected records"""
+        url = f"{self._efetch_url}&{urllib.parse.urlencode(selection)}"
+        
+        self._wait_for_slot()
         try:
             with urllib.request.urlopen(url) as response:
-                content = response.read().decode('utf-8')
-                file_handle.write(content)
+                return response.read().decode('utf-8')
         except urllib.error.HTTPError as e:
             print(f"Error downloading batch: {e}")
             raise
@@ -348,7 +598,8 @@ class PubMedDownloader:
             'db': 'pubmed',
             'term': query,
             'retmax': retmax,
-            'retmode': 'json'
+            'retmode': 'json',
+            'usehistory': 'y'
         }
         
         if self.api_key:
@@ -357,9 +608,12 @@ class PubMedDownloader:
         query = urllib.parse.urlencode(params)
         url = f"{self.base_url}/esearch.fcgi?{query}"
         
+        self._wait_for_slot()
         with urllib.request.urlopen(url) as response:
-            data = json.loads(response.read().decode('utf-8'))
-            return data['esearchresult']['idlist']
+            result = _loads(response.read())['esearchresult']
+            self.webenv = result.get('webenv')
+            self.query_key = result.get('querykey')
+            return result['idlist']
 
 
 class DirectAPIClient:
@@ -379,7 +633,8 @@ class DirectAPIClient:
 
     def __init__(self, provider: str = 'openrouter', model: Optional[str] = None,
                  api_url: Optional[str] = None, api_key: Optional[str] = None,
-                 timeout: int = 30, max_requests: int = 60, rate_period: int = 60):
+                 timeout: int = 30, max_requests: int = 60, rate_period: int = 60,
+                 cache: bool = True, cache_dir: Optional[Path] = None):
         """
         Initialize API client
 
@@ -391,12 +646,19 @@ class DirectAPIClient:
             timeout: Request timeout in seconds
             max_requests: Max requests per rate_period
             rate_period: Time period (seconds) for rate limiting
+            cache: Reuse responses to identical prompts within this run
+            cache_dir: Also keep responses on disk here, for later runs
         """
         self.provider = provider.lower()
         self.timeout = timeout
         self.max_requests = max_requests
         self.rate_period = rate_period
-        self.request_times: List[float] = []
+        self.request_times: deque = deque()
+        self._rate_lock = threading.Lock()
+        self._cache: Optional[Dict[str, str]] = {} if cache else None
+        self.cache_dir = Path(cache_dir) if cache and cache_dir else None
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
 
         if self.provider not in API_CONFIGS:
             raise ValueError(f"Unknown provider: {provider}. Choose from: {list(API_CONFIGS.keys())}")
@@ -408,6 +670,12 @@ class DirectAPIClient:
         self.endpoint = config['endpoint']
         self.full_url = self.base_url.rstrip('/') + self.endpoint
 
+        # Keep one connection per thread open across calls, unless a proxy
+        # is configured, which only urlopen knows how to go through
+        self._url = urllib.parse.urlsplit(self.full_url)
+        self._use_urlopen = self._url.scheme in urllib.request.getproxies()
+        self._local = threading.local()
+
         # Get model
         self.model = model or config['default_model']
 
@@ -419,10 +687,13 @@ class DirectAPIClient:
         else:
             self.api_key = None  # Local models don't need a key
 
-        # Store config functions
-        self.headers_fn = config['headers_fn']
-        self.body_fn = config['body_fn']
+        # Headers and the fixed part of the request body only depend on the
+        # key and model, so they are built once here rather than per call
+        self.headers = {str(k): str(v) for k, v in config['headers_fn'](self.api_key, self.model).items()}
+        self.body_template = {'model': self.model, **config['body_params']}
         self.response_fn = config['response_fn']
+        # Typed decoder working on raw bytes, when msgspec is installed
+        self.decode_fn = _RESPONSE_DECODERS.get(config.get('response_schema'))
 
         print(f"✓ Initialized {config['description']}")
         print(f"  Model: {self.model}")
@@ -431,24 +702,28 @@ class DirectAPIClient:
 
     def _enforce_rate_limit(self):
         """
-        Enforce token bucket rate limiting
+        Enforce sliding-window rate limiting
 
         Maintains sliding window of request times and sleeps when
-        max_requests per rate_period is exceeded.
+        max_requests per rate_period is exceeded. The lock makes worker
+        threads queue here, so concurrent steps pace themselves to the
+        provider limit instead of sleeping blindly.
         """
-        now = time.time()
-
-        # Remove request timestamps older than our rate period
-        self.request_times = [t for t in self.request_times if now - t < self.rate_period]
-
-        if len(self.request_times) >= self.max_requests:
-            oldest_request = self.request_times[0]
-            wait_time = self.rate_period - (now - oldest_request)
-            if wait_time > 0:
-                print(f"  Rate limit exceeded. Waiting {wait_time:.1f}s...")
-                time.sleep(wait_time)
+        with self._rate_lock:
+            now = time.time()
+
+            # Drop request timestamps older than our rate period
+            while self.request_times and now - self.request_times[0] >= self.rate_period:
+                self.request_times.popleft()
+
+            if len(self.request_times) >= self.max_requests:
+                oldest_request = self.request_times.popleft()
+                wait_time = self.rate_period - (now - oldest_request)
+                if wait_time > 0:
+                    print(f"  Rate limit exceeded. Waiting {wait_time:.1f}s...")
+                    time.sleep(wait_time)
 
-        self.request_times.append(time.time())
+            self.request_times.append(time.time())
 
     def call(self, prompt: str, max_retries: int = 3) -> str:
         """
@@ -471,11 +746,17 @@ class DirectAPIClient:
         - Connection issues
         """
 
-        # Prepare request with types
-        headers_dict = self.headers_fn(self.api_key, self.model)
-        headers = {str(k): str(v) for k,v in headers_dict.items()}
-        body = self.body_fn(prompt, self.model)
-        body_json = json.dumps(body).encode('utf-8')
+        # Identical prompts to the same model get the same answer
+        if self._cache is not None:
+            cache_key = self._cache_key(prompt)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
+
+        # Prepare request body from the provider template
+        headers = self.headers
+        body = {**self.body_template, 'messages': [{'role': 'user', 'content': prompt}]}
+        body_json = _dumps(body)
 
         # Retry loop
         for attempt in range(max_retries):
@@ -483,26 +764,22 @@ class DirectAPIClient:
                 # Enforce rate limiting
                 self._enforce_rate_limit()
 
-                # Create request
-                req = urllib.request.Request(
-                    self.full_url,
-                    data=body_json,
-                    headers=headers,
-                    method='POST'
-                )
-
                 # Make request
-                with urllib.request.urlopen(req, timeout=self.timeout) as response:
-                    response_data = json.loads(response.read().decode('utf-8'))
-                    result = self.response_fn(response_data)
+                raw = self._post(body_json, headers)
+                if self.decode_fn is not None:
+                    result = self.decode_fn(raw)
+                else:
+                    result = self.response_fn(_loads(raw))
 
-                    if not result:
-                        raise ValueError("Empty response from API")
+                if not result:
+                    raise ValueError("Empty response from API")
 
-                    # Validate and sanitize response for security
-                    validated_result = self.validate_api_response(result)
+                # Validate and sanitize response for security
+                validated_result = self.validate_api_response(result)
 
-                    return validated_result
+                if self._cache is not None:
+                    self._cache_put(cache_key, validated_result)
+                return validated_result
 
             except urllib.error.HTTPError as e:
                 error_body = e.read().decode('utf-8')
@@ -548,37 +825,136 @@ class DirectAPIClient:
 
         raise ValueError(f"Failed after {max_retries} attempts")
 
+    def _connection(self) -> http.client.HTTPConnection:
+        """Return this thread's persistent connection to the API host"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            if self._url.scheme == 'https':
+                conn_class = http.client.HTTPSConnection
+            else:
+                conn_class = http.client.HTTPConnection
+            conn = conn_class(self._url.hostname, self._url.port, timeout=self.timeout)
+            self._local.conn = conn
+        return conn
+
+    def _post(self, body: bytes, headers: Dict[str, str]) -> bytes:
+        """
+        POST a request body to the API and return the response body
+
+        Errors are raised as urllib.error.HTTPError and URLError, the same
+        as urlopen, so the retry logic in call() handles both paths.
+        """
+        if self._use_urlopen:
+            req = urllib.request.Request(self.full_url, data=body, headers=headers, method='POST')
+            with urllib.request.urlopen(req, timeout=self.timeout) as response:
+                return response.read()
+
+        conn = self._connection()
+        reused = conn.sock is not None
+        path = self._url.path + (f'?{self._url.query}' if self._url.query else '')
+        try:
+            conn.request('POST', path, body=body, headers=headers)
+            response = conn.getresponse()
+            data = response.read()
+        except (http.client.HTTPException, OSError) as e:
+            conn.close()
+            self._local.conn = None
+            if reused and not isinstance(e, TimeoutError):
+                # The server dropped the idle connection, reconnect once
+                return self._post(body, headers)
+            raise urllib.error.URLError(e)
+
+        if response.status >= 400:
+            raise urllib.error.HTTPError(self.full_url, response.status, response.reason,
+                                         response.headers, io.BytesIO(data))
+        return data
+
+    def _cache_key(self, prompt: str) -> str:
+        """Hash the model and prompt into a response cache key"""
+        data = f"{self.model}\0{prompt}".encode('utf-8')
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    def _cache_get(self, key: str) -> Optional[str]:
+        """Look a response up in memory, then in the on-disk cache"""
+        cached = self._cache.get(key)
+        if cached is None and self.cache_dir is not None:
+            try:
+                cached = (self.cache_dir / f"{key}.txt").read_text(encoding='utf-8')
+            except OSError:
+                return None
+            self._cache[key] = cached
+        return cached
+
+    def _cache_put(self, key: str, response: str):
+        """Remember a response in memory and, if enabled, on disk"""
+        self._cache[key] = response
+        if self.cache_dir is not None:
+            # Write then rename, so an interrupted run leaves no partial entry
+            path = self.cache_dir / f"{key}.txt"
+            tmp_path = path.with_name(f"{key}.{threading.get_ident()}.tmp")
+            try:
+                tmp_path.write_text(response, encoding='utf-8')
+                os.replace(tmp_path, path)
+            except OSError as e:
+                print(f"Warning: could not write response cache: {sanitize_error_message(str(e))}")
+
+    def call_batch(self, prompts: List[str], max_workers: int = 8,
+                   max_retries: int = 3) -> List[Any]:
+        """
+        Call the API for many prompts from a pool of worker threads
+
+        Every prompt is submitted before any result is collected, so the
+        requests overlap. Results keep the order of `prompts`; a failed
+        prompt yields its exception instead of a response, as in
+        acall_many().
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self.call, prompt, max_retries) for prompt in prompts]
+            return [future.exception() or future.result() for future in futures]
+
+    async def acall(self, prompt: str, max_retries: int = 3) -> str:
+        """Awaitable version of call(), run in a worker thread"""
+        return await asyncio.to_thread(self.call, prompt, max_retries)
+
+    async def acall_many(self, prompts: List[str], concurrency: int = 8,
+                         max_retries: int = 3) -> List[Any]:
+        """
+        Call the API for many prompts concurrently
+
+        All tasks are created before any is awaited, so up to `concurrency`
+        requests are in flight at once while the shared rate limit still
+        applies. Results keep the order of `prompts`; a failed prompt
+        yields its exception instead of a response.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(prompt: str) -> str:
+            async with semaphore:
+                return await self.acall(prompt, max_retries)
+
+        tasks = [asyncio.create_task(run(prompt)) for prompt in prompts]
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
     def validate_api_response(self, content: str) -> str:
         """Validate and sanitize API response for security"""
-        # Check for suspicious HTML patterns
-        html_patterns = [
-            r'<script.*?>',   # Script tags
-            r'on\w+\s*=',     # HTML event handlers
-            r'javascript:',    # JS protocols
-            r'<\s*iframe\b',   # IFrames
-            r'<\s*link\b',     # Link tags
-            r'<\s*meta\b',     # Meta tags
-            r'/\*\*/.*?/\*\*/' # Obfuscated patterns
-        ]
-
-        # Check for high-risk patterns first
+        # Check for high-risk patterns first; one combined scan rules out
+        # the common clean response before counting the distinct patterns
         dangerous_count = 0
-        for pattern in html_patterns:
-            if re.search(pattern, content, re.IGNORECASE | re.DOTALL):
-                dangerous_count += 1
+        if _HTML_DANGER_RE.search(content):
+            dangerous_count = sum(1 for pattern in _HTML_DANGER_PATTERNS
+                                  if pattern.search(content))
 
         # If number of dangerous patterns exceeds threshold
         max_suspicious_patterns = 3
         if dangerous_count > max_suspicious_patterns:
             raise ValueError(f"API response contains {dangerous_count} dangerous patterns - potential injection attack detected")
 
-        # Escape HTML special characters
-        sanitized = html.escape(content)
+        # Escape HTML special characters, dropping apostrophes (&#x27;) first
+        sanitized = html.escape(content.replace("'", ''))
 
         # Remove any remaining problematic patterns
-        sanitized = re.sub(r'(\&\#(\d{1,3}\;)|\&\#x([0-9a-f]{1,4})\;)', '', sanitized)  # Remove HTML entities
-        sanitized = re.sub(r'%[0-9a-f]{2}', '', sanitized, flags=re.IGNORECASE)        # Remove URL encoding
-        sanitized = re.sub(r'\\u[0-9a-f]{4}', '', sanitized, flags=re.IGNORECASE)       # Remove unicode escapes
+        sanitized = _URL_ESCAPE_RE.sub('', sanitized)    # Remove URL encoding
+        sanitized = _UNICODE_ESCAPE_RE.sub('', sanitized)  # Remove unicode escapes
 
         # Log if significant changes were made
         if len(sanitized) < (len(content) * 0.9):  # More than 10% reduction
@@ -588,40 +964,51 @@ class DirectAPIClient:
 
 
 class PubMedParser:
-    """Parse multiple PubMed export formats"""
+    """Parse multiple PubMed export formats
+    
+    Articles are plain dicts: the pipeline caches them as JSON/YAML and
+    reloads them as dicts, and MEDLINE records carry a variable set of
+    fields beyond the standard pmid/title/abstract/authors/journal/
+    pub_date/doi.
+    """
     
     @staticmethod
     def detect_format(file_path: str) -> str:
         """Detect the format of the input file"""
         path = Path(file_path)
+        suffix = path.suffix.lower()
+        if suffix == '.gz':
+            # Compressed exports are named after their inner format
+            suffix = Path(path.stem).suffix.lower()
         
-        # Check by file extension first
-        if path.suffix.lower() == '.csv':
-            return 'csv'
-        elif path.suffix.lower() == '.xml':
-            return 'xml'
-        elif path.suffix.lower() == '.json':
-            return 'json'
-        elif path.suffix.lower() == '.txt':
-            # Could be MEDLINE or other text format
-            # Check file contents to distinguish
-            return PubMedParser._detect_medline_format(file_path)
-        else:
-            # Try to detect by content
-            return PubMedParser._detect_by_content(file_path)
+        # Check by file extension first; .txt could be MEDLINE or another
+        # text format, anything else is detected by content
+        return _FORMAT_BY_SUFFIX.get(suffix) or (
+            PubMedParser._detect_medline_format if suffix == '.txt'
+            else PubMedParser._detect_by_content)(file_path)
+    
+    @staticmethod
+    def _open_input(file_path, mode: str = 'rb', **kwargs):
+        """Open an export file, decompressing it on the fly if it ends in .gz"""
+        if str(file_path).lower().endswith('.gz'):
+            kwargs.pop('buffering', None)
+            return gzip.open(file_path, mode, **kwargs)
+        return open(file_path, mode, **kwargs)
     
     @staticmethod
     def _detect_medline_format(file_path: str) -> str:
         """Detect if text file is MEDLINE format"""
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+            # The markers are ASCII, so the head is checked as bytes
+            with PubMedParser._open_input(file_path) as f:
                 first_lines = f.read(1000)
                 
                 # MEDLINE format starts with PMID-, TI, AB, etc.
-                if re.search(r'^PMID-\s*\d+', first_lines, re.MULTILINE):
+                # (cheap substring test first, the regex only confirms it)
+                if b'PMID-' in first_lines and _PMID_RE.search(first_lines):
                     return 'medline'
                 # CSV has comma-separated headers
-                elif ',' in first_lines.split('\n')[0]:
+                elif b',' in first_lines.partition(b'\n')[0]:
                     return 'csv'
                 else:
                     return 'medline'  # Default to MEDLINE for unknown text
@@ -633,16 +1020,18 @@ class PubMedParser:
     def _detect_by_content(file_path: str) -> str:
         """Detect format by examining file content"""
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read(500)
+            # The markers are ASCII, so a short binary read is enough
+            with PubMedParser._open_input(file_path) as f:
+                content = f.read(256)
+                stripped = content.lstrip()
                 
-                if content.strip().startswith('{'):
+                if stripped.startswith(b'{'):
                     return 'json'
-                elif content.strip().startswith('<'):
+                elif stripped.startswith(b'<'):
                     return 'xml'
-                elif 'PMID-' in content or 'TI  -' in content:
+                elif b'PMID-' in content or b'TI  -' in content:
                     return 'medline'
-                elif ',' in content:
+                elif b',' in content:
                     return 'csv'
                 else:
                     return 'medline'  # Default
@@ -662,6 +1051,15 @@ class PubMedParser:
         Returns:
             List of article dictionaries with standard fields
         """
+        return list(PubMedParser.parse_iter(file_path, format_hint))
+    
+    @staticmethod
+    def parse_iter(file_path: str, format_hint: Optional[str] = None) -> Iterator[Dict]:
+        """
+        Parse PubMed export file lazily, yielding each article as soon as it is complete
+        
+        The path and format are checked immediately; articles are read on demand.
+        """
         # Validate file path before processing
         validated_path = validate_file_path(file_path)
         
@@ -669,13 +1067,13 @@ class PubMedParser:
         file_format = format_hint or PubMedParser.detect_format(str(validated_path))
         
         if file_format == 'csv':
-            return PubMedParser.parse_csv(file_path)
+            return PubMedParser._iter_csv(validated_path)
         elif file_format == 'medline':
-            return PubMedParser.parse_medline(file_path)
+            return PubMedParser._iter_medline(validated_path)
         elif file_format == 'xml':
-            return PubMedParser.parse_xml(file_path)
+            return PubMedParser._iter_xml(validated_path)
         elif file_format == 'json':
-            return PubMedParser.parse_json(file_path)
+            return PubMedParser._iter_json(validated_path)
         else:
             raise ValueError(f"Unsupported format: {file_format}")
     
@@ -683,24 +1081,44 @@ class PubMedParser:
     def parse_csv(file_path: str) -> List[Dict]:
         """Parse PubMed CSV export"""
         validated_path = validate_file_path(file_path)
-        articles = []
+        return list(PubMedParser._iter_csv(validated_path))
+    
+    @staticmethod
+    def _parse_csv_pandas(validated_path: Path) -> List[Dict]:
+        """Read the needed CSV columns with the pandas C parser"""
+        renames = {column: key for key, column in _CSV_FIELDS}
+        df = pd.read_csv(validated_path, usecols=lambda column: column in renames,
+                         dtype=str, encoding='utf-8-sig', keep_default_na=False,
+                         index_col=False)
+        df = df.rename(columns=renames).reindex(columns=list(renames.values()))
+        df = df.fillna('').astype(str).apply(lambda column: column.str.strip())
+        return df[df['pmid'] != ''].to_dict('records')
+    
+    @staticmethod
+    def _iter_csv(validated_path: Path) -> Iterator[Dict]:
+        """Yield articles from a CSV export at an already validated path"""
+        if pd is not None:
+            try:
+                yield from PubMedParser._parse_csv_pandas(validated_path)
+                return
+            except (pd.errors.ParserError, pd.errors.EmptyDataError):
+                pass  # Ragged or empty file, the csv module copes with both
         
-        with open(validated_path, 'r', encoding='utf-8-sig') as f:
-            reader = csv.DictReader(f)
+        with PubMedParser._open_input(validated_path, 'rt', encoding='utf-8-sig') as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            
+            # Resolve the column of each field once from the header
+            columns = [header.index(column) if column in header else None
+                       for _, column in _CSV_FIELDS]
+            keys = [key for key, _ in _CSV_FIELDS]
+            
             for row in reader:
-                article = {
-                    'pmid': str(row.get('PMID', '')).strip(),
-                    'title': row.get('Title', '').strip(),
-                    'abstract': row.get('Abstract', '').strip(),
-                    'authors': row.get('Authors', '').strip(),
-                    'journal': row.get('Journal', '').strip(),
-                    'pub_date': row.get('Publication Date', '').strip(),
-                    'doi': row.get('DOI', '').strip(),
-                }
-                if article['pmid']:
-                    articles.append(article)
-        
-        return articles
+                size = len(row)
+                values = [row[i].strip() if i is not None and i < size else ''
+                          for i in columns]
+                if values[0]:
+                    yield dict(zip(keys, values))
     
     @staticmethod
     def parse_medline(file_path: str) -> List[Dict]:
@@ -717,86 +1135,82 @@ class PubMedParser:
         AD  - Author Address
         SO  - Journal Citation
         """
-        validated_path = validate_file_path(file_path)
-        articles = []
+        return list(PubMedParser._iter_medline(validate_file_path(file_path)))
+    
+    @staticmethod
+    def _iter_medline(validated_path: Path) -> Iterator[Dict]:
+        """Yield articles from a MEDLINE export at an already validated path"""
+        # Lines are scanned as bytes; only field values are decoded
+        with PubMedParser._open_input(validated_path, buffering=131072) as f:
+            yield from PubMedParser._iter_medline_lines(f)
+    
+    @staticmethod
+    def _iter_medline_lines(lines) -> Iterator[Dict]:
+        """Run the MEDLINE tag-line state machine over an iterable of byte lines"""
         current_article: Dict[str, str] = {}
         current_field: Optional[str] = None
-        current_value: List[str] = []
+        current_value: List[bytes] = []
+        normalize = PubMedParser._normalize_medline_article
         
-        with open(validated_path, 'r', encoding='utf-8', errors='ignore') as f:
-            for line in f:
-                # Check if this is a new field line (starts with tag and dash)
-                field_match = re.match(r'^([A-Z]+)\s*-\s*(.*)', line.rstrip())
+        for line in lines:
+            # Check if this is a new field line (starts with tag and dash).
+            # Standard lines keep the tag in columns 1-4 and "- " in 5-6,
+            # so only irregular lines need the regex. Common tags are a set
+            # hit; rarer ones fall through to the two bytes predicates.
+            stripped = line.rstrip()
+            tag = stripped[:4].rstrip()
+            if stripped[4:6] in (b'- ', b'-') and (
+                    tag in _MEDLINE_TAGS or (tag.isalpha() and tag.isupper())):
+                field_match = (tag, stripped[6:].lstrip())
+            elif stripped[:1].isupper():
+                field_match = _MEDLINE_FIELD_RE.match(stripped)
+                field_match = field_match.groups() if field_match else None
+            else:
+                field_match = None
+            
+            if field_match:
+                # Save previous field if exists
+                if current_field:
+                    value = current_value[0] if len(current_value) == 1 else b' '.join(current_value)
+                    current_article[current_field] = value.decode('utf-8', 'ignore').strip()
                 
-                if field_match:
-                    # Save previous field if exists
-                    if current_field:
-                        value = ' '.join(current_value).strip()
-                        current_article[current_field] = value
-                    
-                    # Start new field
-                    current_field = field_match.group(1)
-                    current_value = [field_match.group(2)]
-                    
-                    # Check if this is PMID (marks start of new article)
-                    if current_field == 'PMID':
-                        # Save previous article if exists
-                        if current_article:
-                            articles.append(PubMedParser._normalize_medline_article(current_article))
-                        current_article = {}
+                # Start new field
+                current_field = field_match[0].decode('ascii')
+                current_value.clear()
+                current_value.append(field_match[1])
                 
-                elif current_field and line.startswith(' '):
-                    # Continuation of previous field (indented line)
-                    current_value.append(line.strip())
+                # Check if this is PMID (marks start of new article)
+                if current_field == 'PMID':
+                    # Save previous article if exists
+                    if current_article:
+                        yield normalize(current_article)
+                    current_article = {}
             
-            # Save last field and article
-            if current_field:
-                value = ' '.join(current_value).strip()
-                current_article[current_field] = value
-            if current_article:
-                articles.append(PubMedParser._normalize_medline_article(current_article))
+            elif current_field and line.startswith(b' '):
+                # Continuation of previous field (indented line). The spec
+                # indents six spaces, but hand-edited exports often use
+                # fewer, so any leading space counts.
+                current_value.append(line.strip())
         
-        return articles
+        # Save last field and article
+        if current_field:
+            value = current_value[0] if len(current_value) == 1 else b' '.join(current_value)
+            current_article[current_field] = value.decode('utf-8', 'ignore').strip()
+        if current_article:
+            yield normalize(current_article)
     
     @staticmethod
     def _normalize_medline_article(medline_dict: Dict) -> Dict[str, str]:
         """Convert MEDLINE field names to standard format"""
-        # Map MEDLINE field codes to standard names
-        field_map = {
-            'PMID': 'pmid',
-            'TI': 'title',
-            'AB': 'abstract',
-            'AU': 'authors',
-            'FAU': 'authors_full',
-            'AD': 'affiliation',
-            'SO': 'source',
-            'TA': 'journal',
-            'JT': 'journal_full',
-            'VI': 'volume',
-            'IP': 'issue',
-            'DP': 'pub_date',
-            'PG': 'pages',
-            'AID': 'article_id',
-            'DOI': 'doi',
-            'PT': 'publication_type',
-            'DEP': 'electronic_pub_date',
-            'PL': 'publisher_location',
-            'LA': 'language',
-            'OT': 'keywords',
-        }
-        
-        normalized = {}
-        for medline_key, value in medline_dict.items():
-            standard_key = field_map.get(medline_key, medline_key.lower())
-            normalized[standard_key] = value
+        # Rename all fields in one comprehension; mapped names are never empty
+        field_name = _MEDLINE_FIELD_MAP.get
+        normalized = {field_name(medline_key) or medline_key.lower(): value
+                      for medline_key, value in medline_dict.items()}
         
         # Ensure required fields exist
-        if 'pmid' not in normalized:
-            normalized['pmid'] = ''
-        if 'title' not in normalized:
-            normalized['title'] = ''
-        if 'abstract' not in normalized:
-            normalized['abstract'] = ''
+        normalized.setdefault('pmid', '')
+        normalized.setdefault('title', '')
+        normalized.setdefault('abstract', '')
         
         return normalized
     
@@ -807,83 +1221,101 @@ class PubMedParser:
         
         Requires xml module (from stdlib in Python 3.2+)
         """
-        validated_path = validate_file_path(file_path)
-        try:
-            import xml.etree.ElementTree as ET
-        except ImportError:
-            raise ImportError("XML parsing requires Python 3.2+")
-        
-        articles = []
-        tree = ET.parse(validated_path)
-        root = tree.getroot()
-        
-        # Handle different XML structures
-        # Try PubmedArticleSet format first
-        for article_elem in root.findall('.//PubmedArticle'):
-            for elem in root.findall('.//PubmedArticle'):
-                if elem is not None:
-                    article = PubMedParser._parse_xml_article(elem)
-                    if article.get('pmid'):
-                        articles.append(article)
-        
-        return articles
+        return list(PubMedParser._iter_xml(validate_file_path(file_path)))
+    
+    @staticmethod
+    def _iter_xml(validated_path: Path) -> Iterator[Dict]:
+        """Yield articles from an XML export at an already validated path"""
+        # Stream the file and drop each PubmedArticle once it is parsed,
+        # so memory stays flat on large bulk exports
+        with PubMedParser._open_input(validated_path) as f:
+            if lxml_etree is not None:
+                context = lxml_etree.iterparse(f, events=('end',), tag='PubmedArticle',
+                                               resolve_entities=False, no_network=True)
+            else:
+                context = ET.iterparse(f, events=('end',))
+            
+            for event, elem in context:
+                if elem.tag != 'PubmedArticle':
+                    continue
+                article = PubMedParser._parse_xml_article(elem)
+                if article.get('pmid'):
+                    yield article
+                elem.clear()
+                if lxml_etree is not None:
+                    # Also drop the already processed siblings kept by the parent
+                    while elem.getprevious() is not None:
+                        del elem.getparent()[0]
     
     @staticmethod
     def _parse_xml_article(article_elem) -> Dict[str, str]:
         """Extract article data from XML element"""
-        # Try different path structures
-        pmid_elem = article_elem.find('.//PMID')
-        pmid = pmid_elem.text if pmid_elem is not None else ''
-        
-        title_elem = article_elem.find('.//ArticleTitle')
-        title = title_elem.text if title_elem is not None else ''
+        pmid = title = abstract = journal = pub_date = doi = None
+        abstract_texts = []
+        authors = []
         
-        abstract_elem = article_elem.find('.//Abstract/AbstractText')
-        abstract = abstract_elem.text if abstract_elem is not None else ''
+        # Walk the article once and dispatch on the tag; the first match of
+        # each field wins, as with find() in document order. lxml can skip
+        # every other element (MeSH terms, history dates...) in C.
+        # The walk runs to the end: authors and abstract sections are
+        # collected from the whole article, so there is no early exit.
+        if isinstance(article_elem, ET.Element):
+            elements = article_elem.iter()
+        else:
+            elements = article_elem.iter(*_XML_ARTICLE_TAGS)
+        for elem in elements:
+            tag = elem.tag
+            if tag == 'PMID':
+                if pmid is None:
+                    pmid = elem.text
+            elif tag == 'ArticleTitle':
+                if title is None:
+                    title = elem.text
+            elif tag == 'Abstract':
+                if abstract is None:
+                    first_section = elem.find('AbstractText')
+                    if first_section is not None:
+                        abstract = first_section.text
+            elif tag == 'AbstractText':
+                if elem.text:
+                    abstract_texts.append(elem.text)
+            elif tag == 'Author':
+                # One pass over the author's children instead of two finds
+                last_name = fore_name = ''
+                for child in elem:
+                    if child.tag == 'LastName':
+                        last_name = child.text or ''
+                    elif child.tag == 'ForeName':
+                        fore_name = child.text or ''
+                if last_name:
+                    authors.append(f"{fore_name} {last_name}" if fore_name else last_name)
+            elif tag == 'Journal':
+                if journal is None:
+                    journal_title = elem.find('Title')
+                    if journal_title is not None:
+                        journal = journal_title.text
+            elif tag == 'PubDate':
+                if pub_date is None:
+                    year = elem.find('Year')
+                    if year is not None:
+                        pub_date = year.text
+            elif tag == 'ArticleId':
+                if doi is None and elem.get('IdType') == 'doi':
+                    doi = elem.text
         
         # Join multiple abstract sections if they exist
         if not abstract:
-            abstract_texts = []
-            for abstract_section in article_elem.findall('.//AbstractText'):
-                if abstract_section.text:
-                    abstract_texts.append(abstract_section.text)
             abstract = ' '.join(abstract_texts)
-        
-        # Get authors
-        authors = []
-        for author in article_elem.findall('.//Author'):
-            last_name = author.find('LastName')
-            fore_name = author.find('ForeName')
-            if last_name is not None and last_name.text:
-                name = last_name.text
-                if fore_name is not None and fore_name.text:
-                    name = f"{fore_name.text} {last_name.text}"
-                authors.append(name)
         authors_str = ', '.join(authors)
         
-        # Get journal
-        journal_elem = article_elem.find('.//Journal/Title')
-        journal = journal_elem.text if journal_elem is not None else ''
-        
-        # Get publication date
-        pub_date_elem = article_elem.find('.//PubDate/Year')
-        pub_date = pub_date_elem.text if pub_date_elem is not None else ''
-        
-        # Get DOI
-        doi = ''
-        for aid in article_elem.findall('.//ArticleId'):
-            if aid.get('IdType') == 'doi':
-                doi = aid.text
-                break
-        
         return {
-            'pmid': str(pmid).strip(),
-            'title': str(title).strip(),
-            'abstract': str(abstract).strip(),
+            'pmid': (pmid or '').strip(),
+            'title': (title or '').strip(),
+            'abstract': abstract.strip(),
             'authors': authors_str,
-            'journal': str(journal).strip(),
-            'pub_date': str(pub_date).strip(),
-            'doi': str(doi).strip(),
+            'journal': (journal or '').strip(),
+            'pub_date': (pub_date or '').strip(),
+            'doi': (doi or '').strip(),
         }
     
     @staticmethod
@@ -893,36 +1325,46 @@ class PubMedParser:
         
         Expected structure from NCBI API
         """
-        validated_path = validate_file_path(file_path)
-        with open(validated_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        articles = []
+        return list(PubMedParser._iter_json(validate_file_path(file_path)))
+    
+    @staticmethod
+    def _iter_json(validated_path: Path) -> Iterator[Dict]:
+        """Yield articles from a JSON export at an already validated path"""
+        with PubMedParser._open_input(validated_path) as f:
+            raw = f.read()
+        # Decode straight from bytes, with orjson when it is installed
+        data = _loads(raw)
         
         # Handle different JSON structures
         # Check for common NCBI API response structure
-        if 'result' in data:
+        if isinstance(data, list):
+            results = data
+        elif not isinstance(data, dict):
+            raise ValueError(f"Expected a JSON array or object, got {type(data).__name__}")
+        elif 'result' in data:
             results = data['result']
+            # esummary keys the records by UID and lists them under 'uids'
+            if isinstance(results, dict):
+                results = [results[uid] for uid in results.get('uids', []) if uid in results]
         elif 'articles' in data:
             results = data['articles']
-        elif isinstance(data, list):
-            results = data
         else:
             results = [data]
         
+        if not isinstance(results, list):
+            raise ValueError(f"Expected a list of articles, got {type(results).__name__}")
+        
         for item in results:
             if isinstance(item, dict):
                 article = PubMedParser._normalize_json_article(item)
                 if article.get('pmid'):
-                    articles.append(article)
-        
-        return articles
+                    yield article
     
     @staticmethod
     def _normalize_json_article(json_article: Dict) -> Dict[str, str]:
         """Normalize JSON article to standard format"""
         
-        # Try various possible field names
+        # Try various possible field names, stopping at the first present
         pmid = (
             json_article.get('pmid') or
             json_article.get('PMID') or
@@ -971,6 +1413,7 @@ class PubMedParser:
         
         doi = json_article.get('doi') or json_article.get('DOI', '')
         
+        # str() and strip() return clean str values unchanged, without copying
         return {
             'pmid': str(pmid).strip(),
             'title': str(title).strip(),
@@ -1019,11 +1462,14 @@ class PlanGenerator:
         llm_client: Configured DirectAPIClient instance
         workdir: Path for generated files
         prompt: Loaded prompt template text
+        emit_yaml: Also write the plan as 00_plan.yaml
     """
 
-    def __init__(self, llm_client: DirectAPIClient, workdir: Path):
+    def __init__(self, llm_client: DirectAPIClient, workdir: Path,
+                 emit_yaml: bool = True):
         self.llm = llm_client
         self.workdir = workdir
+        self.emit_yaml = emit_yaml
         self.workdir.mkdir(exist_ok=True)
         self.prompt = self._load_prompt('plan_generator')
 
@@ -1055,28 +1501,12 @@ class PlanGenerator:
             prompt = self.prompt.format(request=safe_request)
             response_text = self.llm.call(prompt)
 
-            # Attempt multiple JSON extraction patterns
-            json_match = re.search(r'```json\s*({.*?})\s*```', response_text, re.DOTALL)
-            if not json_match:
-                # Fall back to original pattern
-                json_match = re.search(r'\{[\s\S]*\}', response_text)
-            
-            if not json_match:
-                raise ValueError("No valid JSON object found in LLM response")
-            
             try:
-                # Get matched JSON string and unescape HTML entities
-                json_str = json_match.group(1) if json_match.lastindex else json_match.group()
-                clean_json = html.unescape(json_str)
-                
-                # Parse components with validation
-                components = json.loads(clean_json)
+                components = parse_llm_json(response_text)
             except json.JSONDecodeError as e:
-                # Add debug information to help diagnose JSON issues
-                clean_json = html.unescape(json_match.group())
-                snippet_start = max(0, e.pos - 50)
-                snippet_end = min(len(clean_json), e.pos + 50)
-                json_snippet = clean_json[snippet_start:snippet_end]
+                # Add debug information to help diagnose JSON issues; e.pos
+                # indexes e.doc, the string that was parsed
+                json_snippet = e.doc[max(0, e.pos - 50):e.pos + 50]
                 print(f"JSON parsing error: {e.msg}\nNear: {json_snippet}\nFull response start:\n{html.unescape(response_text[:500])}")
                 raise
 
@@ -1113,12 +1543,15 @@ class PlanGenerator:
             output_path_json.write_text(json.dumps(components, indent=2))
             
             # Save YAML
-            yaml_output = yaml.dump(components, sort_keys=False, indent=2)
-            output_path_yaml.write_text(yaml_output)
+            if self.emit_yaml:
+                yaml_output = yaml.dump(components, Dumper=_YAML_DUMPER,
+                                        sort_keys=False, indent=2)
+                output_path_yaml.write_text(yaml_output)
 
             print(f"✓ Generated plan:")
             print(f"  Saved to: {output_path_json} (JSON)")
-            print(f"  Saved to: {output_path_yaml} (YAML)")
+            if self.emit_yaml:
+                print(f"  Saved to: {output_path_yaml} (YAML)")
             print(f"\nPubMed query:\n{components['query']}")
         except Exception as e:
             sanitized_err = sanitize_error_message(str(e))
@@ -1130,25 +1563,50 @@ class CDSSLitReviewProcessor:
     """Main pipeline processor for systematic literature review"""
 
     def __init__(self, llm_client: DirectAPIClient, workdir: str = "output",
-                 log_verbose: bool = True):
+                 log_verbose: bool = True, max_workers: int = 8,
+                 screening_batch_size: int = 1):
         """Initialize processor with LLM client"""
         self.llm = llm_client
+        self.max_workers = max_workers
+        self.screening_batch_size = screening_batch_size
         self.workdir = Path(workdir)
         self.workdir.mkdir(exist_ok=True)
         self.log_verbose = log_verbose
         self.start_time = datetime.now()
+        self.plan_data = None
+        self._prompt_cache: Dict[str, str] = {}
+        # Worker threads report errors concurrently; one lock keeps each
+        # report's lines together
+        self._print_lock = threading.Lock()
 
         # Initialize log file
         print(f"Pipeline initialized at {self.start_time}")
         print(f"Using {llm_client.provider} with model {llm_client.model}")
 
+    def _report(self, *lines: str):
+        """Print related lines as one block, safe to call from worker threads"""
+        with self._print_lock:
+            print('\n'.join(lines))
+
     def _load_prompt(self, name: str) -> str:
-        """Load prompt template from prompts directory"""
-        prompt_path = Path(__file__).parent / 'prompts' / f'{name}.txt'
-        try:
-            return prompt_path.read_text(encoding='utf-8').strip()
-        except IOError as e:
-            raise ValueError(f"Failed to load prompt '{name}': {str(e)}") from e
+        """Load prompt template from prompts directory, once per name"""
+        if name not in self._prompt_cache:
+            prompt_path = Path(__file__).parent / 'prompts' / f'{name}.txt'
+            try:
+                self._prompt_cache[name] = prompt_path.read_text(encoding='utf-8').strip()
+            except IOError as e:
+                raise ValueError(f"Failed to load prompt '{name}': {str(e)}") from e
+        return self._prompt_cache[name]
+
+    def _load_plan(self) -> Dict:
+        """Load 00_plan.json once and reuse it for every step"""
+        if self.plan_data is None:
+            plan_file = self.workdir / "00_plan.json"
+            if not plan_file.exists():
+                raise ValueError(f"Plan file {plan_file.name} not found - run with --plan first")
+            with open(plan_file, 'r', encoding='utf-8') as f:
+                self.plan_data = json.load(f)
+        return self.plan_data
 
     def run_complete_pipeline(self, pubmed_file: str):
         """Execute the complete workflow from CSV to synthesis"""
@@ -1179,18 +1637,21 @@ class CDSSLitReviewProcessor:
             print("\n[STEP 2/6] Screening titles and abstracts...")
             screening_results = self._screen_articles(articles, screening_file)
 
-            include_count = sum(1 for r in screening_results if r['decision'] == 'INCLUDE')
-            exclude_count = sum(1 for r in screening_results if r['decision'] == 'EXCLUDE')
-            uncertain_count = sum(1 for r in screening_results if r['decision'] == 'UNCERTAIN')
+            # Count decisions and collect included PMIDs in one pass
+            decision_counts = Counter()
+            included_pmids = set()
+            for r in screening_results:
+                decision_counts[r['decision']] += 1
+                if r['decision'] == 'INCLUDE':
+                    included_pmids.add(r['pmid'])
 
             print(f"✓ Screening complete:")
-            print(f"  - INCLUDE: {include_count}")
-            print(f"  - EXCLUDE: {exclude_count}")
-            print(f"  - UNCERTAIN: {uncertain_count}")
+            print(f"  - INCLUDE: {decision_counts['INCLUDE']}")
+            print(f"  - EXCLUDE: {decision_counts['EXCLUDE']}")
+            print(f"  - UNCERTAIN: {decision_counts['UNCERTAIN']}")
 
             # Step 3: Extract data from included articles
             extraction_file = self.workdir / "03_extracted_data.json"
-            included_pmids = {r['pmid'] for r in screening_results if r['decision'] == 'INCLUDE'}
             included_articles = [a for a in articles if a['pmid'] in included_pmids]
 
             if not included_articles:
@@ -1278,12 +1739,7 @@ class CDSSLitReviewProcessor:
     def _screen_articles(self, articles: List[Dict], screening_file: Path) -> List[Dict]:
         """Screen articles for inclusion with caching support"""
         # Load screening criteria from generated metadata
-        plan_file = self.workdir / "00_plan.json"
-        if not plan_file.exists():
-            raise ValueError(f"Review topic file {plan_file.name} not found - run with --plan first")
-
-        with open(plan_file, 'r', encoding='utf-8') as f:
-            plan = json.load(f)
+        plan = self._load_plan()
 
         # Validate required criteria
         screening = plan.get('screening', {})
@@ -1296,21 +1752,43 @@ class CDSSLitReviewProcessor:
         if not exclusion:
             raise ValueError("Screening criteria missing exclusion list in topic file")
 
-        # Format criteria
-        inclusion_str = "\n- ".join([""] + inclusion)
-        exclusion_str = "\n- ".join([""] + exclusion)
-        topic = plan['topic']
+        # Format and sanitize the criteria once, they are the same in every prompt
+        safe_inclusion = sanitize_api_input("\n- ".join([""] + inclusion))
+        safe_exclusion = sanitize_api_input("\n- ".join([""] + exclusion))
+        safe_topic = sanitize_api_input(plan['topic'])
         screening_prompt = self._load_prompt('screening')
 
+        def validate_decision(result):
+            # Validate the structure
+            validate_llm_json_response(
+                result,
+                required_keys=['pmid', 'decision', 'confidence', 'reasoning'],
+                key_types={
+                    'pmid': str,
+                    'decision': str,
+                    'confidence': (float, int),
+                    'reasoning': str,
+                    'key_terms': list
+                }
+            )
+            
+            # Validate decision value
+            if result['decision'] not in ['INCLUDE', 'EXCLUDE', 'UNCERTAIN']:
+                raise ValueError(f"Invalid decision value: {result['decision']}")
+                
+            # Validate confidence range
+            if not (0 <= result['confidence'] <= 1):
+                raise ValueError(f"Confidence {result['confidence']} out of range")
+
         def process_article(article):
             # Sanitize article fields
             safe_title = sanitize_api_input(article.get('title', ''))
             safe_abstract = sanitize_api_input(article.get('abstract', ''))
 
             prompt = screening_prompt.format(
-                topic=sanitize_api_input(topic),
-                inclusion=sanitize_api_input(inclusion_str),
-                exclusion=sanitize_api_input(exclusion_str),
+                topic=safe_topic,
+                inclusion=safe_inclusion,
+                exclusion=safe_exclusion,
                 pmid=article['pmid'],  # PMID is numeric so safe
                 title=safe_title,
                 abstract=safe_abstract
@@ -1320,7 +1798,7 @@ class CDSSLitReviewProcessor:
                 response_text = self.llm.call(prompt)
             except Exception as e:
                 sanitized_err = sanitize_error_message(str(e))
-                print(f"Screening failed for PMID {article['pmid']}: {sanitized_err}")
+                self._report(f"Screening failed for PMID {article['pmid']}: {sanitized_err}")
                 return {
                     'pmid': article['pmid'],
                     'decision': 'UNCERTAIN',
@@ -1330,47 +1808,13 @@ class CDSSLitReviewProcessor:
                 }
 
             try:
-                # Attempt multiple JSON extraction patterns
-                json_match = re.search(r'```json\s*({.*?})\s*```', response_text, re.DOTALL)
-                if not json_match:
-                    json_match = re.search(r'\{[\s\S]*\}', response_text)
-                
-                if not json_match:
-                    raise ValueError("No valid JSON found in LLM response")
-                
-                # Get matched JSON string and unescape HTML entities
-                json_str = json_match.group(1) if json_match.lastindex else json_match.group()
-                clean_json = html.unescape(json_str)
-                
-                # Parse JSON response
-                result = json.loads(clean_json)
-                
-                # Validate the structure
-                validate_llm_json_response(
-                    result,
-                    required_keys=['pmid', 'decision', 'confidence', 'reasoning'],
-                    key_types={
-                        'pmid': str,
-                        'decision': str,
-                        'confidence': (float, int),
-                        'reasoning': str,
-                        'key_terms': list
-                    }
-                )
-                
-                # Validate decision value
-                if result['decision'] not in ['INCLUDE', 'EXCLUDE', 'UNCERTAIN']:
-                    raise ValueError(f"Invalid decision value: {result['decision']}")
-                    
-                # Validate confidence range
-                if not (0 <= result['confidence'] <= 1):
-                    raise ValueError(f"Confidence {result['confidence']} out of range")
-                    
+                result = parse_llm_json(response_text)
+                validate_decision(result)
                 return result
             except Exception as e:
                 sanitized_err = sanitize_error_message(str(e))
-                print(f"Screening error for PMID {article['pmid']}: {sanitized_err}")
-                print(f"Response snippet: {response_text[:300]}")
+                self._report(f"Screening error for PMID {article['pmid']}: {sanitized_err}",
+                             f"Response snippet: {response_text[:300]}")
                 return {
                     'pmid': article['pmid'],
                     'decision': 'UNCERTAIN',
@@ -1379,6 +1823,51 @@ class CDSSLitReviewProcessor:
                     'key_terms': []
                 }
 
+        def process_batch(batch):
+            # Several articles share one prompt, so the topic and criteria
+            # are sent once per batch; any problem with the batch answer
+            # falls back to screening its articles one by one
+            articles_str = "\n\n".join(
+                f"PMID: {article['pmid']}\n"
+                f"TITLE: {sanitize_api_input(article.get('title', ''))}\n"
+                f"ABSTRACT: {sanitize_api_input(article.get('abstract', ''))}"
+                for article in batch
+            )
+            prompt = batch_prompt.format(
+                topic=safe_topic,
+                inclusion=safe_inclusion,
+                exclusion=safe_exclusion,
+                count=len(batch),
+                articles=articles_str
+            )
+
+            try:
+                response_text = self.llm.call(prompt)
+                decisions = parse_llm_json(response_text, array=True)
+                if not isinstance(decisions, list):
+                    raise ValueError("LLM response is not a JSON array")
+                for result in decisions:
+                    validate_decision(result)
+
+                by_pmid = {result['pmid']: result for result in decisions}
+                if len(decisions) != len(batch) or any(a['pmid'] not in by_pmid for a in batch):
+                    raise ValueError(f"Expected {len(batch)} decisions matching the batch PMIDs")
+                return [by_pmid[article['pmid']] for article in batch]
+            except Exception as e:
+                self._report(f"Batch screening failed ({sanitize_error_message(str(e))}) - screening {len(batch)} articles one by one")
+                return [process_article(article) for article in batch]
+
+        if self.screening_batch_size > 1:
+            batch_prompt = self._load_prompt('screening_batch')
+            return self._process_with_caching(
+                cache_file=screening_file,
+                all_items=articles,
+                item_key='pmid',
+                process_fn=process_batch,
+                cache_label='screening decisions',
+                batch_size=self.screening_batch_size
+            )
+
         return self._process_with_caching(
             cache_file=screening_file,
             all_items=articles,
@@ -1390,24 +1879,22 @@ class CDSSLitReviewProcessor:
     def _extract_article_data(self, articles: List[Dict], extraction_file: Path) -> List[Dict]:
         """Extract article data with caching support"""
         # Load extract fields template
-        plan_file = self.workdir / "00_plan.json"
         extract_json = "{}"  # Default empty template
-        if plan_file.exists():
+        if (self.workdir / "00_plan.json").exists():
             try:
-                with open(plan_file, 'r', encoding='utf-8') as f:
-                    plan = json.load(f)
-                extract = plan.get('extract', {})
+                extract = self._load_plan().get('extract', {})
                 extract_json = json.dumps(extract, indent=2)
             except Exception as e:
                 print(f"Error loading extract fields: {str(e)} - using empty template")
 
+        safe_extract = sanitize_api_input(extract_json)
         extraction_prompt = self._load_prompt('extraction')
 
         def process_article(article):
             safe_title = sanitize_api_input(article.get('title', ''))
             safe_abstract = sanitize_api_input(article.get('abstract', ''))
             prompt = extraction_prompt.format(
-                extract=sanitize_api_input(extract_json),
+                extract=safe_extract,
                 pmid=article['pmid'],
                 title=safe_title,
                 abstract=safe_abstract
@@ -1417,8 +1904,7 @@ class CDSSLitReviewProcessor:
                 response_text = self.llm.call(prompt)
             except Exception as e:
                 sanitized_err = sanitize_error_message(str(e))
-                print(f"Extraction failed for PMID {article['pmid']}: {sanitized_err}")
-                print(f"Response snippet: {response_text[:300]}")
+                self._report(f"Extraction failed for PMID {article['pmid']}: {sanitized_err}")
                 return {
                     'pmid': article['pmid'],
                     'title': article['title'],
@@ -1426,20 +1912,7 @@ class CDSSLitReviewProcessor:
                 }
 
             try:
-                # Attempt multiple JSON extraction patterns
-                json_match = re.search(r'```json\s*({.*?})\s*```', response_text, re.DOTALL)
-                if not json_match:
-                    json_match = re.search(r'\{[\s\S]*\}', response_text)
-                
-                if not json_match:
-                    raise ValueError("No valid JSON found in LLM response")
-
-                # Get matched JSON string and unescape HTML entities
-                json_str = json_match.group(1) if json_match.lastindex else json_match.group()
-                clean_json = html.unescape(json_str)
-                
-                # Parse JSON response
-                data = json.loads(clean_json)
+                data = parse_llm_json(response_text)
                 
                 # Validate the structure
                 validate_llm_json_response(
@@ -1462,8 +1935,8 @@ class CDSSLitReviewProcessor:
                 return data
             except Exception as e:
                 sanitized_err = sanitize_error_message(str(e))
-                print(f"Extraction failed for PMID {article['pmid']}: {sanitized_err}")
-                print(f"Response snippet: {response_text[:300]}")
+                self._report(f"Extraction failed for PMID {article['pmid']}: {sanitized_err}",
+                             f"Response snippet: {response_text[:300]}")
                 return {
                     'pmid': article['pmid'],
                     'title': article['title'],
@@ -1481,15 +1954,10 @@ class CDSSLitReviewProcessor:
     def _assess_quality(self, articles: List[Dict], quality_file: Path) -> List[Dict]:
         """Assess study quality with caching support"""
         # Load quality tool from plan metadata
-        plan_file = self.workdir / "00_plan.json"
-        if not plan_file.exists():
-            raise ValueError(f"Review plan file {plan_file.name} not found")
+        plan = self._load_plan()
 
-        with open(plan_file, 'r', encoding='utf-8') as f:
-            plan = json.load(f)
-        
         # Normalize quality tool name - lowercase and remove non-alphanumeric
-        quality_tool = re.sub(r'[^a-z0-9]', '', plan.get('quality', 'grade').lower())
+        quality_tool = _NON_ALNUM_RE.sub('', plan.get('quality', 'grade').lower())
         quality_prompt = self._load_prompt(f'quality_assessment_{quality_tool}')
 
         def process_article(article):
@@ -1499,28 +1967,14 @@ class CDSSLitReviewProcessor:
                 abstract=article['abstract']
             )
 
+            response_text = ''
             try:
                 response_text = self.llm.call(prompt)
-                
-                # Attempt multiple JSON extraction patterns
-                json_match = re.search(r'```json\s*({.*?})\s*```', response_text, re.DOTALL)
-                if not json_match:
-                    json_match = re.search(r'\{[\s\S]*\}', response_text)
-
-                if not json_match:
-                    raise ValueError("No valid JSON found in LLM response")
-
-                # Get matched JSON string and unescape HTML entities
-                json_str = json_match.group(1) if json_match.lastindex else json_match.group()
-                clean_json = html.unescape(json_str)
-
-                # Parse and validate response
-                result = json.loads(clean_json)
-                return result
+                return parse_llm_json(response_text)
             except Exception as e:
                 sanitized_err = sanitize_error_message(str(e))
-                print(f"Quality assessment failed for PMID {article['pmid']}: {sanitized_err}")
-                print(f"Response snippet: {response_text[:300]}")
+                self._report(f"Quality assessment failed for PMID {article['pmid']}: {sanitized_err}",
+                             f"Response snippet: {response_text[:300]}")
                 return {
                     'pmid': article['pmid'],
                     'assessment_error': sanitized_err[:200]
@@ -1538,21 +1992,27 @@ class CDSSLitReviewProcessor:
         """Perform thematic synthesis and identify patterns"""
 
         # Load review topic from metadata
-        plan_file = self.workdir / "00_plan.json"
-        if not plan_file.exists():
-            raise ValueError(f"Plan file {plan_file.name} not found")
-
-        with open(plan_file, 'r', encoding='utf-8') as f:
-            plan = json.load(f)
+        plan = self._load_plan()
 
         topic = plan['topic']
 
-        # Prepare summary of extracted data
-        summary_dict = {
-            'total_studies': len(extracted_data),
-            'studies_sample': extracted_data[:3],  # First 3 for context
-            'total_count': len(extracted_data)
-        }
+        # Prepare summary of extracted data: the first 3 studies for context,
+        # fewer if their records would not fit the prompt budget. Compact,
+        # unescaped JSON, since indentation and \u escapes only add tokens.
+        sample = extracted_data[:3]
+        while True:
+            summary_dict = {
+                'total_studies': len(extracted_data),
+                'studies_sample': sample,
+                'total_count': len(extracted_data)
+            }
+            data_sample = json.dumps(summary_dict, separators=(',', ':'), ensure_ascii=False)
+            if len(data_sample) <= MAX_SYNTHESIS_SAMPLE or len(sample) <= 1:
+                break
+            sample = sample[:-1]
+        if len(data_sample) > MAX_SYNTHESIS_SAMPLE:
+            print(f"WARN: Synthesis data sample cut to {MAX_SYNTHESIS_SAMPLE} characters")
+            data_sample = data_sample[:MAX_SYNTHESIS_SAMPLE] + ' ...[truncated]'
 
         # Validate and prepare analysis points
         analysis_points = plan.get('analysis', [])
@@ -1572,8 +2032,8 @@ class CDSSLitReviewProcessor:
         synthesis_prompt = synthesis_template.format(
             topic=topic,
             total_studies=len(extracted_data),
-            data_sample=json.dumps(summary_dict, indent=2),
-            analysis_points='\n'.join(f'   - {point}' for point in analysis_points),
+            data_sample=data_sample,
+            analysis_points='\n'.join([f'   - {point}' for point in analysis_points]),
             quality_tool=quality_tool
         )
 
@@ -1588,106 +2048,98 @@ class CDSSLitReviewProcessor:
             return "Error generating synthesis"
 
     def _generate_summary_table(self, extracted_data: List[Dict]):
-        """Generate CSV summary table with or without pandas"""
-
-        rows = []
-        for item in extracted_data:
-            if 'extraction_error' in item:
-                continue
-
-            # Handle imaging_modality - could be list, string, or missing
-            modality = item.get('imaging_modality', [])
-            if isinstance(modality, list):
-                modality_str = ', '.join(str(m) for m in modality) if modality else ''
-            else:
-                modality_str = str(modality) if modality else ''
-
-            # Handle sample size
-            sample_size = item.get('sample_size', {})
-            if isinstance(sample_size, dict):
-                n_patients = sample_size.get('total_patients', '')
-            else:
-                n_patients = ''
-
-            # Handle key metrics
-            key_metrics = item.get('key_metrics', {})
-            if isinstance(key_metrics, dict):
-                sensitivity = key_metrics.get('sensitivity', '')
-                specificity = key_metrics.get('specificity', '')
-                auc = key_metrics.get('auc', '')
-                accuracy = key_metrics.get('accuracy', '')
-            else:
-                sensitivity = specificity = auc = accuracy = ''
-
-            # Create base row with standard fields
-            row = {
-                'PMID': item.get('pmid', ''),
-                'Year': item.get('year', ''),
-                'Study Design': item.get('study_design', ''),
-                'Clinical Domain': item.get('clinical_domain', ''),
-                'Imaging Modality': modality_str,
-                'Sample Size (N)': n_patients,
-                'Sensitivity': sensitivity,
-                'Specificity': specificity,
-                'AUC': auc,
-                'Accuracy': accuracy,
-                'Main Findings': str(item.get('main_findings', ''))[:100]
-            }
-
-            # Add any fields from the 'extract' section
-            if 'extract' in item and isinstance(item['extract'], dict):
-                for field_name, field_value in item['extract'].items():
-                    safe_field_name = sanitize_filename(str(field_name))
-                    row[safe_field_name] = str(field_value)
-
-            rows.append(row)
-
-        if not rows:
+        """Stream the CSV summary table, one row per extracted study"""
+        items = [item for item in extracted_data if 'extraction_error' not in item]
+        if not items:
             print("No valid data to create summary table")
             return
 
-        # Try using pandas if available
-        if pd is not None:
-            try:
-                df = pd.DataFrame(rows)
-                output_file = self.workdir / "06_summary_characteristics.csv"
-                df.to_csv(output_file, index=False)
-                print(f"Summary table saved ({len(rows)} studies) - CSV format")
-                return
-            except Exception as e:
-                sanitized_err = sanitize_error_message(str(e))
-                print(f"Error creating summary table: {sanitized_err}")
+        # Fixed columns first, then the 'extract' fields in first-seen order;
+        # only the names are collected up front, rows are written as built.
+        # Each distinct field name is sanitized once, here.
+        field_names: Dict[str, str] = {}
+        for item in items:
+            if isinstance(item.get('extract'), dict):
+                for field_name in item['extract']:
+                    if field_name not in field_names:
+                        field_names[field_name] = sanitize_filename(str(field_name))
+        headers = list(dict.fromkeys(_SUMMARY_COLUMNS + tuple(field_names.values())))
 
-        # Fall back to manual CSV creation without pandas
         try:
             output_file = self.workdir / "06_summary_characteristics.csv"
-            with open(output_file, 'w', encoding='utf-8', newline='') as f:
-                if rows:
-                    # Collect all headers from all rows
-                    all_headers = sorted({key for row in rows for key in row.keys()})
-                    
-                    # Write header
-                    f.write(','.join(f'"{h}"' for h in all_headers) + '\n')
-
-                    # Write rows
-                    for row in rows:
-                        values = [str(row.get(h, '')).replace('"', '""') for h in all_headers]
-                        f.write(','.join(f'"{v}"' for v in values) + '\n')
-
-            print(f"Summary table saved ({len(rows)} studies) - Manual CSV creation (no pandas)")
+            with open(output_file, 'w', encoding='utf-8', newline='',
+                      buffering=1 << 20) as f:
+                # csv.writer quotes in C; DictWriter would also diff each
+                # row's keys against the header in Python
+                writer = csv.writer(f, lineterminator='\n')
+                writer.writerow(headers)
+                writer.writerows([row.get(h, '') for h in headers]
+                                 for row in (self._summary_row(item, field_names)
+                                             for item in items))
+            print(f"Summary table saved ({len(items)} studies) - CSV format")
         except Exception as e:
-            print(f"Error creating summary table: {str(e)}", "ERROR")
+            sanitized_err = sanitize_error_message(str(e))
+            print(f"Error creating summary table: {sanitized_err}")
+
+    @staticmethod
+    def _summary_row(item: Dict, field_names: Dict[str, str]) -> Dict[str, Any]:
+        """Build the summary table row of one extracted study"""
+        # Handle imaging_modality - could be list, string, or missing
+        modality = item.get('imaging_modality', [])
+        if isinstance(modality, list):
+            modality_str = ', '.join(str(m) for m in modality) if modality else ''
+        else:
+            modality_str = str(modality) if modality else ''
+
+        # Handle sample size
+        sample_size = item.get('sample_size', {})
+        if isinstance(sample_size, dict):
+            n_patients = sample_size.get('total_patients', '')
+        else:
+            n_patients = ''
+
+        # Handle key metrics
+        key_metrics = item.get('key_metrics', {})
+        if isinstance(key_metrics, dict):
+            sensitivity = key_metrics.get('sensitivity', '')
+            specificity = key_metrics.get('specificity', '')
+            auc = key_metrics.get('auc', '')
+            accuracy = key_metrics.get('accuracy', '')
+        else:
+            sensitivity = specificity = auc = accuracy = ''
+
+        # Create base row with standard fields
+        row = {
+            'PMID': item.get('pmid', ''),
+            'Year': item.get('year', ''),
+            'Study Design': item.get('study_design', ''),
+            'Clinical Domain': item.get('clinical_domain', ''),
+            'Imaging Modality': modality_str,
+            'Sample Size (N)': n_patients,
+            'Sensitivity': sensitivity,
+            'Specificity': specificity,
+            'AUC': auc,
+            'Accuracy': accuracy,
+            'Main Findings': str(item.get('main_findings', ''))[:100]
+        }
+
+        # Add any fields from the 'extract' section
+        if 'extract' in item and isinstance(item['extract'], dict):
+            for field_name, field_value in item['extract'].items():
+                row[field_names[field_name]] = str(field_value)
+
+        return row
 
     def _process_with_caching(self, cache_file: Path, all_items: List[Dict],
                             item_key: str, process_fn: callable,
-                            cache_label: str) -> List[Dict]:
+                            cache_label: str, batch_size: int = 1) -> List[Dict]:
         """
         Generic processing with caching support
 
         Implements memoization pattern with disk persistence:
-        1. Load existing cached results
+        1. Load existing cached results, plus any journaled ones
         2. Identify new items needing processing
-        3. Process new items in batches
+        3. Process new items concurrently, journaling each result
         4. Combine with cached results
         5. Persist combined results
 
@@ -1695,13 +2147,17 @@ class CDSSLitReviewProcessor:
             cache_file: Path to cache file
             all_items: Complete list of items to process
             item_key: Unique identifier key in items
-            process_fn: Function to process individual items
+            process_fn: Function to process individual items, or lists of
+                items returning lists of results when batch_size > 1
             cache_label: Human-readable label for cache type
+            batch_size: Number of items handed to process_fn at once
 
         Returns:
             Combined list of cached and new results
         """
-        # Try loading existing cache
+        # Try loading existing cache. It is read whole on purpose: the cached
+        # results are returned to the next step along with the new ones, so
+        # streaming just the ids (e.g. with ijson) would not lower peak memory
         cached_results = []
         if cache_file.exists():
             try:
@@ -1710,8 +2166,27 @@ class CDSSLitReviewProcessor:
             except Exception as e:
                 print(f"  Cache load error: {str(e)} - creating new cache")
 
-        # Get new items not in cache
+        # Results finished after the last snapshot of an interrupted run
         cached_ids = {item[item_key] for item in cached_results if item_key in item}
+        journal_file = cache_file.with_name(f"{cache_file.stem}.pending.jsonl")
+        if journal_file.exists():
+            recovered = 0
+            with open(journal_file, 'rb') as f:
+                for line in f:
+                    try:
+                        item = _loads(line)
+                    except json.JSONDecodeError:
+                        continue  # Line cut short by the interruption
+                    if item.get(item_key) not in cached_ids:
+                        cached_results.append(item)
+                        cached_ids.add(item.get(item_key))
+                        recovered += 1
+            print(f"✓ Recovered {recovered} journaled {cache_label}")
+            # Fold them into the step file now, in case nothing is left to do
+            self._save_file(cached_results, cache_file)
+            journal_file.unlink()
+
+        # Get new items not in cache
         new_items = [item for item in all_items if item[item_key] not in cached_ids]
 
         if not new_items:
@@ -1720,37 +2195,77 @@ class CDSSLitReviewProcessor:
 
         results = []
         total_new = len(new_items)
-
-        for i, item in enumerate(new_items):
-            result = process_fn(item)
-            results.append(result)
-
-            # Save periodically
-            if (i + 1) % 10 == 0 or i == total_new - 1:
-                all_results = cached_results + results
-                self._save_file(all_results, cache_file)
-                print(f"  Saved {len(all_results)} {cache_label}...")
-                time.sleep(1)  # Rate limiting
-
-        return cached_results + results
+        reported = 0
+        progress_interval = max(10, (len(cached_results) + total_new) // 50)
+        if batch_size > 1:
+            work = [new_items[i:i + batch_size] for i in range(0, total_new, batch_size)]
+        else:
+            work = new_items
+
+        # The LLM calls are network-bound, so they run in worker threads;
+        # the client's rate limit is shared by all of them. Results come
+        # back in item order and are saved from this thread only.
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor, \
+                open(journal_file, 'ab') as journal:
+            for output in executor.map(process_fn, work):
+                outputs = output if batch_size > 1 else [output]
+                results.extend(outputs)
+                # The append-only journal is the checkpoint: one line per
+                # result, so saving costs the same however large the file is
+                journal.write(b''.join(_dumps(result) + b'\n' for result in outputs))
+                journal.flush()
+
+                if len(results) - reported >= progress_interval:
+                    self._report(f"  Journaled {len(cached_results) + len(results)} {cache_label}...")
+                    reported = len(results)
+
+        # One full rewrite at the end replaces the journal
+        all_results = cached_results + results
+        self._save_file(all_results, cache_file)
+        print(f"  Saved {len(all_results)} {cache_label}")
+        journal_file.unlink()
+
+        return all_results
 
     def _load_file(self, filepath: Path) -> Any:
         """Load data from JSON or YAML based on file extension"""
-        with open(filepath, 'r', encoding='utf-8') as f:
-            if filepath.suffix.lower() == '.yaml':
+        if filepath.suffix.lower() == '.yaml':
+            with open(filepath, 'r', encoding='utf-8') as f:
                 return yaml.safe_load(f)
-            else:
-                return json.load(f)
+        # One read and one decode from bytes, with orjson when installed
+        return _loads(filepath.read_bytes())
 
     def _save_file(self, data: Any, filepath: Path):
         """Save data as JSON or YAML based on file extension"""
+        if filepath.suffix.lower() != '.yaml' and orjson is not None:
+            # Data orjson rejects (non-str keys, huge ints) goes to json.dump
+            try:
+                encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            except orjson.JSONEncodeError:
+                pass
+            else:
+                with open(filepath, 'wb') as f:
+                    f.write(encoded)
+                return
         with open(filepath, 'w', encoding='utf-8') as f:
             if filepath.suffix.lower() == '.yaml':
-                yaml.dump(data, f, sort_keys=False, indent=2)
+                yaml.dump(data, f, Dumper=_YAML_DUMPER, sort_keys=False, indent=2)
             else:
+                # Step files are read by people too, so they stay indented
                 json.dump(data, f, indent=2, ensure_ascii=False)
 
 
+def _positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def create_parser():
     """Create argument parser"""
     parser = argparse.ArgumentParser(
@@ -1788,6 +2303,9 @@ Supported Providers:
     parser.add_argument('--api-url', help='Custom API URL (overrides provider default)')
     parser.add_argument('--api-key', help='API key (uses env var if not specified)')
     parser.add_argument('--quiet', action='store_true', help='Suppress log output')
+    parser.add_argument('--no-cache', action='store_true', help='Always send prompts to the API, even repeated ones (disables the .llm_cache directory)')
+    parser.add_argument('--workers', type=_positive_int, default=8, help='Number of concurrent LLM requests per pipeline step (default: 8)')
+    parser.add_argument('--screening-batch', type=int, default=1, help='Articles screened per LLM request (default: 1)')
 
     return parser
 
@@ -1819,12 +2337,17 @@ def main():
 
     args = parser.parse_args()
 
-    # Validate workdir exists if specified, create if it doesn't
+    # Create workdir if it doesn't exist; mkdir itself reports an existing
+    # one, so there is no separate exists() check to race with
     if args.workdir:
         workdir_path = Path(args.workdir)
-        if not workdir_path.exists():
+        try:
+            workdir_path.mkdir(parents=True)
             print(f"Creating work directory: {args.workdir}")
-            workdir_path.mkdir(parents=True, exist_ok=True)
+        except FileExistsError:
+            if not workdir_path.is_dir():
+                print(f"Error: '{args.workdir}' exists and is not a directory")
+                sys.exit(1)
 
     # Handle PubMed download
     if args.download:
@@ -1832,28 +2355,28 @@ def main():
             print("Error: --workdir required for download mode")
             sys.exit(1)
         
-        # Ensure workdir exists
-        workdir_path = Path(args.workdir)
-        workdir_path.mkdir(parents=True, exist_ok=True)
-        
-        # Get query from plan file in working directory
+        # Read query from plan file in working directory
         plan_file = workdir_path / "00_plan.json"
-        if not plan_file.exists():
+        try:
+            with open(plan_file, 'r', encoding='utf-8') as f:
+                plan_data = json.load(f)
+        except FileNotFoundError:
             print(f"Error: Plan file '{plan_file}' not found in working directory")
             sys.exit(1)
         
-        # Read query from plan file
-        with open(plan_file, 'r', encoding='utf-8') as f:
-            plan_data = json.load(f)
-        
         query = plan_data.get('query', '')
         if not query:
             print("Error: No PubMed query found in plan file")
             sys.exit(1)
         
-        # Check if articles.txt already exists
+        # Check if articles.txt already exists; an empty file left by a
+        # failed download is fetched again
         output_file = Path(args.workdir) / "articles.txt"
-        if output_file.exists():
+        try:
+            output_size = os.path.getsize(output_file)
+        except FileNotFoundError:
+            output_size = 0
+        if output_size > 0:
             print(f"✓ Articles file already exists: {output_file}")
             print("You can now process this file with:")
             print(f"  python systematic_review_assistant.py {args.workdir}")
@@ -1868,7 +2391,11 @@ def main():
             print("No articles found for this query")
             sys.exit(1)
         
-        downloader.download_medline(pmids, str(output_file))
+        if downloader.webenv and downloader.query_key:
+            downloader.download_via_history(downloader.webenv, downloader.query_key,
+                                            len(pmids), str(output_file))
+        else:
+            downloader.download_medline(pmids, str(output_file))
         print(f"\n✓ Download complete! {len(pmids)} articles saved to {output_file}")
         print("\nYou can now process this file with:")
         print(f"  python systematic_review_assistant.py {args.workdir}")
@@ -1894,7 +2421,9 @@ def main():
             provider=args.provider,
             model=args.model,
             api_url=args.api_url,
-            api_key=args.api_key
+            api_key=args.api_key,
+            cache=not args.no_cache,
+            cache_dir=Path(args.workdir) / ".llm_cache"
         )
 
         # Generate plan components if plan description provided
@@ -1914,7 +2443,9 @@ def main():
         processor = CDSSLitReviewProcessor(
             llm_client=llm_client,
             workdir=args.workdir,
-            log_verbose=not args.quiet
+            log_verbose=not args.quiet,
+            max_workers=args.workers,
+            screening_batch_size=args.screening_batch
         )
         input_path = Path(args.workdir) / "articles.txt"
         processor.run_complete_pipeline(str(input_path))